@@ -0,0 +1,142 @@
+"""Batched archiver moving long-expired projects into ``projects_archive``.
+
+Run ``python -m app.archive`` to move projects that expired more than
+``ARCHIVE_RETENTION_DAYS`` ago.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date, timedelta
+from typing import NamedTuple, Optional
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app import models
+from app.cache import invalidate_owners_from_job
+from app.config import get_settings
+from app.database import get_sessionmaker
+from app.stats import record_changes
+
+logger = logging.getLogger(__name__)
+
+_ARCHIVED_COLUMNS = (
+    models.Project.id,
+    models.Project.name,
+    models.Project.description,
+    models.Project.expiration_date,
+    models.Project.owner_id,
+    models.Project.created_at,
+    models.Project.updated_at,
+)
+
+
+class ArchiveReport(NamedTuple):
+    archived: int
+    batches: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.archived / self.seconds if self.seconds > 0 else 0.0
+
+
+def archive_expired_projects(
+    db: Session,
+    as_of: Optional[date] = None,
+    retention_days: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    pause_seconds: Optional[float] = None,
+) -> ArchiveReport:
+    """Move projects that expired more than ``retention_days`` before ``as_of`` to the archive.
+
+    Each batch deletes up to ``batch_size`` rows with ``DELETE ... RETURNING`` and inserts
+    exactly those rows into ``projects_archive`` in the same transaction, so a project is
+    always in one table or the other. The sweep then sleeps ``pause_seconds`` to leave
+    I/O and replication headroom for live traffic.
+    """
+
+    settings = get_settings()
+    as_of = as_of or date.today()
+    retention_days = settings.archive_retention_days if retention_days is None else retention_days
+    batch_size = batch_size or settings.archive_batch_size
+    pause_seconds = settings.archive_batch_pause_seconds if pause_seconds is None else pause_seconds
+    cutoff = as_of - timedelta(days=retention_days)
+    archived = batches = 0
+    position: Optional[tuple[date, int]] = None
+    started = time.perf_counter()
+
+    while True:
+        stmt = select(models.Project.expiration_date, models.Project.id).where(
+            models.Project.expiration_date < cutoff
+        )
+        if position is not None:
+            stmt = stmt.where(tuple_(models.Project.expiration_date, models.Project.id) > position)
+        rows = db.execute(
+            stmt.order_by(models.Project.expiration_date, models.Project.id).limit(batch_size)
+        ).all()
+        if not rows:
+            db.commit()
+            break
+
+        # Re-check the cutoff so a project extended since it was read stays live.
+        removed = db.execute(
+            delete(models.Project)
+            .where(
+                models.Project.id.in_([row.id for row in rows]),
+                models.Project.expiration_date < cutoff,
+            )
+            .returning(*_ARCHIVED_COLUMNS)
+        ).all()
+        if removed:
+            db.execute(insert(models.ArchivedProject), [row._asdict() for row in removed])
+            record_changes(db, [(row.owner_id, row.expiration_date, -1) for row in removed])
+        db.commit()
+        invalidate_owners_from_job(row.owner_id for row in removed)
+
+        position = (rows[-1].expiration_date, rows[-1].id)
+        batches += 1
+        archived += len(removed)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "batch %d: %d projects archived (%.0f rows/s)",
+            batches,
+            archived,
+            archived / elapsed if elapsed > 0 else 0.0,
+        )
+        if len(rows) < batch_size:
+            break
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    return ArchiveReport(archived, batches, time.perf_counter() - started)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--retention-days", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--pause", type=float, default=None, help="seconds between batches")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with get_sessionmaker()() as db:
+        report = archive_expired_projects(
+            db, args.as_of, args.retention_days, args.batch_size, args.pause
+        )
+    logger.info(
+        "done: %d archived in %d batches, %.1fs (%.0f rows/s)",
+        report.archived,
+        report.batches,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+import importlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from functools import lru_cache
+from typing import Any
+
+from app.config import get_settings
+
+_MISSING = object()
+
+
+class CacheBackend:
+    """Key/value store behind the result caches; implement it to plug in a shared cache.
+
+    Keys are tuples of primitives and values are pydantic models or tuples of them, so a
+    networked backend only needs to pickle or JSON-encode them.
+    """
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, int]:
+        raise NotImplementedError
+
+
+class TTLCache(CacheBackend):
+    """Thread-safe LRU cache whose entries also expire after a time-to-live.
+
+    A ``max_size`` of zero disables the cache: every lookup misses and nothing is stored.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float | None = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """Store ``value``; ``ttl_seconds`` overrides the cache-wide TTL for this entry."""
+
+        if self.max_size <= 0:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@lru_cache
+def get_user_cache() -> TTLCache:
+    """Return the process-wide cache of authenticated users keyed by token subject."""
+
+    settings = get_settings()
+    return TTLCache(settings.user_cache_max_size, settings.user_cache_ttl_seconds)
+
+
+def invalidate_user(email: str) -> None:
+    """Drop a cached user so the next request re-reads it from the database."""
+
+    get_user_cache().delete(email)
+
+
+@lru_cache
+def get_recent_writers() -> TTLCache:
+    """Return the process-wide set of owners who wrote within the read-your-writes window."""
+
+    settings = get_settings()
+    return TTLCache(settings.read_your_writes_max_owners, settings.read_your_writes_seconds)
+
+
+def mark_recent_write(owner_id: int) -> None:
+    """Pin the owner's reads to the primary until the read-your-writes window passes."""
+
+    get_recent_writers().set(owner_id, True)
+
+
+def has_recent_write(owner_id: int) -> bool:
+    return get_recent_writers().get(owner_id, False)
+
+
+class ProjectCache:
+    """Owner-scoped cache of project reads with precise write-through invalidation.
+
+    Every key embeds the owner's current generation token. A write replaces the token,
+    which orphans all of that owner's entries at once without enumerating them; orphans
+    age out through the backend's LRU and TTL. An evicted token is simply regenerated,
+    so eviction can only cause misses, never stale reads.
+
+    ``shared`` says whether other processes see the same backend, so that their writes
+    reach this cache too.
+    """
+
+    def __init__(self, backend: CacheBackend, shared: bool = False):
+        self.backend = backend
+        self.shared = shared
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, owner_id: int, key: tuple[Hashable, ...], load: Callable[[], Any]) -> Any:
+        # Capture the generation before loading: a write that commits while we read the
+        # database bumps it, so the possibly stale result lands under an orphaned key.
+        generation = self._generation(owner_id)
+        full_key = ("projects", owner_id, generation, *key)
+        value = self.backend.get(full_key, _MISSING)
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if value is _MISSING:
+            value = load()
+            self.backend.set(full_key, value)
+        return value
+
+    def invalidate_owner(self, owner_id: int) -> None:
+        self.backend.set(("projects", owner_id, "generation"), uuid.uuid4().hex)
+
+    def clear(self) -> None:
+        self.backend.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": self.backend.stats().get("size", 0),
+        }
+
+    def _generation(self, owner_id: int) -> str:
+        key = ("projects", owner_id, "generation")
+        generation = self.backend.get(key)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(key, generation)
+        return generation
+
+
+@lru_cache
+def get_project_cache() -> ProjectCache:
+    """Return the process-wide project cache, built from ``PROJECT_CACHE_BACKEND`` if set."""
+
+    settings = get_settings()
+    if settings.project_cache_backend:
+        module_name, _, factory_name = settings.project_cache_backend.partition(":")
+        factory = getattr(importlib.import_module(module_name), factory_name)
+        return ProjectCache(factory(settings), shared=True)
+    return ProjectCache(
+        TTLCache(settings.project_cache_max_size, settings.project_cache_ttl_seconds)
+    )
+
+
+def invalidate_owners_from_job(owner_ids: Iterable[int]) -> None:
+    """Drop cached reads of owners whose projects a batch job changed outside the API.
+
+    Only a shared ``PROJECT_CACHE_BACKEND`` reaches the API workers. With the in-process
+    default the job's own cache is not read by anyone, and the workers keep serving their
+    entries for those owners until ``PROJECT_CACHE_TTL_SECONDS`` runs out.
+    """
+
+    cache = get_project_cache()
+    if cache.shared:
+        for owner_id in set(owner_ids):
+            cache.invalidate_owner(owner_id)
@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -20,9 +21,55 @@ class Settings(BaseSettings):
         "postgresql+psycopg://postgres:postgres@db:5432/project_registry",
         alias="DATABASE_URL",
     )
+    async_database_url: str | None = Field(None, alias="ASYNC_DATABASE_URL")
+    database_read_url: str | None = Field(None, alias="DATABASE_READ_URL")
+    async_database_read_url: str | None = Field(None, alias="ASYNC_DATABASE_READ_URL")
+    read_your_writes_seconds: float = Field(5.0, alias="READ_YOUR_WRITES_SECONDS")
+    read_your_writes_max_owners: int = Field(100_000, alias="READ_YOUR_WRITES_MAX_OWNERS")
+    db_async: bool = Field(False, alias="DB_ASYNC")
+    db_pool_size: int = Field(5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(30.0, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(True, alias="DB_POOL_PRE_PING")
+    db_pool_use_lifo: bool = Field(False, alias="DB_POOL_USE_LIFO")
+    db_warm_connections: int = Field(0, alias="DB_WARM_CONNECTIONS")
+    db_statement_timeout_ms: int | None = Field(None, alias="DB_STATEMENT_TIMEOUT_MS")
+    db_cached_statements: bool = Field(True, alias="DB_CACHED_STATEMENTS")
+    db_compiled_cache_size: int = Field(500, alias="DB_COMPILED_CACHE_SIZE")
+    db_prepared_statements: bool = Field(True, alias="DB_PREPARED_STATEMENTS")
+    db_prepare_threshold: int = Field(5, alias="DB_PREPARE_THRESHOLD")
     jwt_secret_key: str = Field("change-me", alias="JWT_SECRET_KEY")
     jwt_algorithm: str = Field("HS256", alias="JWT_ALGORITHM")
     access_token_expire_minutes: int = Field(60, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    jwt_cache_max_size: int = Field(4096, alias="JWT_CACHE_MAX_SIZE")
+    password_hash_scheme: Literal["bcrypt", "pbkdf2_sha256"] = Field(
+        "bcrypt",
+        alias="PASSWORD_HASH_SCHEME",
+    )
+    bcrypt_rounds: int = Field(12, alias="BCRYPT_ROUNDS")
+    pbkdf2_iterations: int = Field(600_000, alias="PBKDF2_ITERATIONS")
+    password_hash_target_ms: float | None = Field(None, alias="PASSWORD_HASH_TARGET_MS")
+    password_hash_workers: int = Field(2, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_pending: int = Field(16, alias="PASSWORD_HASH_MAX_PENDING")
+    password_hash_retry_after_seconds: int = Field(1, alias="PASSWORD_HASH_RETRY_AFTER_SECONDS")
+    user_cache_max_size: int = Field(1024, alias="USER_CACHE_MAX_SIZE")
+    user_cache_ttl_seconds: float = Field(30.0, alias="USER_CACHE_TTL_SECONDS")
+    project_cache_max_size: int = Field(10_000, alias="PROJECT_CACHE_MAX_SIZE")
+    project_cache_ttl_seconds: float = Field(60.0, alias="PROJECT_CACHE_TTL_SECONDS")
+    project_cache_backend: str | None = Field(None, alias="PROJECT_CACHE_BACKEND")
+    projects_page_size: int = Field(100, alias="PROJECTS_PAGE_SIZE")
+    projects_max_page_size: int = Field(1000, alias="PROJECTS_MAX_PAGE_SIZE")
+    projects_bulk_max_items: int = Field(1000, alias="PROJECTS_BULK_MAX_ITEMS")
+    stats_global_shards: int = Field(16, alias="STATS_GLOBAL_SHARDS")
+    fast_json_responses: bool = Field(True, alias="FAST_JSON_RESPONSES")
+    metrics_enabled: bool = Field(False, alias="METRICS_ENABLED")
+    slow_request_ms: float | None = Field(None, alias="SLOW_REQUEST_MS")
+    slow_request_log_max_statements: int = Field(50, alias="SLOW_REQUEST_LOG_MAX_STATEMENTS")
+    expiration_sweep_batch_size: int = Field(1000, alias="EXPIRATION_SWEEP_BATCH_SIZE")
+    archive_retention_days: int = Field(90, alias="ARCHIVE_RETENTION_DAYS")
+    archive_batch_size: int = Field(1000, alias="ARCHIVE_BATCH_SIZE")
+    archive_batch_pause_seconds: float = Field(0.1, alias="ARCHIVE_BATCH_PAUSE_SECONDS")
 
 
 @lru_cache
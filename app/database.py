@@ -1,32 +1,205 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+import itertools
+from functools import lru_cache
+from typing import Any, Generic, Sequence, TypeVar
 
-from app.config import get_settings
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.sql import functions
 
-settings = get_settings()
+from app.config import Settings, get_settings
+from app.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
 
-engine = create_engine(
-    settings.database_url,
-    future=True,
-    pool_pre_ping=True,
-)
+T = TypeVar("T")
+
+
+def engine_options(url: str, settings: Settings, is_async: bool = False) -> dict[str, Any]:
+    """Pool and connection keyword arguments for ``create_engine`` built from settings."""
+
+    url_object = make_url(url)
+    if url_object.get_backend_name() == "sqlite":
+        # SQLite uses its own single-file pools; sizing and timeouts do not apply.
+        return {
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "query_cache_size": settings.db_compiled_cache_size,
+        }
+
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        # With pre-ping off, recycle bounds connection age and LIFO keeps the hot
+        # connections busy so idle ones are the ones that time out server-side.
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_use_lifo": settings.db_pool_use_lifo,
+        "query_cache_size": settings.db_compiled_cache_size,
+    }
+    connect_args: dict[str, Any] = {}
+    timeout_ms = settings.db_statement_timeout_ms
+    if timeout_ms is not None and url_object.get_backend_name() == "postgresql":
+        if url_object.get_driver_name() == "asyncpg":
+            connect_args["server_settings"] = {"statement_timeout": str(timeout_ms)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={timeout_ms}"
+    if url_object.get_driver_name() in ("psycopg", "psycopg_async"):
+        # psycopg prepares a query server-side once it has run this many times on a
+        # connection; None turns preparation off (e.g. behind PgBouncer in transaction mode).
+        connect_args["prepare_threshold"] = (
+            settings.db_prepare_threshold if settings.db_prepared_statements else None
+        )
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Build the primary engine on first use; ``create_app``'s lifespan warms it."""
+
+    settings = get_settings()
+    engine = create_engine(
+        settings.database_url,
+        future=True,
+        **engine_options(settings.database_url, settings),
+    )
+    instrument_engine(engine)
+    return engine
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker[Session]:
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=get_engine(),
+        expire_on_commit=False,
+        future=True,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``from app.database import engine, SessionLocal`` working without building
+    # the engine at import time.
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-    expire_on_commit=False,
-    future=True,
-)
 
 Base = declarative_base()
 
 
+@compiles(functions.now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP has second resolution and a different text format
+    # than SQLAlchemy's bound datetimes, which breaks keyset comparisons on timestamps.
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
 def get_db():
     """Yield a database session for request lifetime."""
 
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
         db.close()
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Build the async engine and session factory on first use."""
+
+    settings = get_settings()
+    url = settings.async_database_url or settings.database_url
+    async_engine = create_async_engine(url, **engine_options(url, settings, is_async=True))
+    instrument_engine(async_engine.sync_engine)
+    return async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+async def get_async_db():
+    """Yield an async database session for request lifetime."""
+
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+class ReadReplicas(Generic[T]):
+    """Round-robin choice among the session factories of the configured read replicas."""
+
+    def __init__(self, factories: Sequence[T]):
+        self.factories = tuple(factories)
+        self._counter = itertools.count()
+
+    def __bool__(self) -> bool:
+        return bool(self.factories)
+
+    def next(self) -> T:
+        return self.factories[next(self._counter) % len(self.factories)]
+
+
+def _replica_urls(urls: str | None) -> list[str]:
+    return [url.strip() for url in (urls or "").split(",") if url.strip()]
+
+
+@lru_cache
+def get_read_replicas() -> ReadReplicas[sessionmaker[Session]]:
+    """Session factories for ``DATABASE_READ_URL`` (comma-separated); empty when unset."""
+
+    settings = get_settings()
+    factories = []
+    for url in _replica_urls(settings.database_read_url):
+        replica = create_engine(url, future=True, **engine_options(url, settings))
+        instrument_engine(replica)
+        factories.append(
+            sessionmaker(autoflush=False, bind=replica, expire_on_commit=False, future=True)
+        )
+    return ReadReplicas(factories)
+
+
+@lru_cache
+def get_async_read_replicas() -> ReadReplicas[async_sessionmaker[AsyncSession]]:
+    """Async session factories for ``ASYNC_DATABASE_READ_URL`` or ``DATABASE_READ_URL``."""
+
+    settings = get_settings()
+    factories = []
+    urls = settings.async_database_read_url or settings.database_read_url
+    for url in _replica_urls(urls):
+        replica = create_async_engine(url, **engine_options(url, settings, is_async=True))
+        instrument_engine(replica.sync_engine)
+        factories.append(
+            async_sessionmaker(bind=replica, autoflush=False, expire_on_commit=False)
+        )
+    return ReadReplicas(factories)
+
+
+async def dispose_engines() -> None:
+    """Close every pool built so far and forget it, so the next use starts afresh."""
+
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    if get_async_sessionmaker.cache_info().currsize:
+        await get_async_sessionmaker().kw["bind"].dispose()
+    if get_read_replicas.cache_info().currsize:
+        for factory in get_read_replicas().factories:
+            factory.kw["bind"].dispose()
+    if get_async_read_replicas.cache_info().currsize:
+        for factory in get_async_read_replicas().factories:
+            await factory.kw["bind"].dispose()
+    for cached in (
+        get_engine,
+        get_sessionmaker,
+        get_async_sessionmaker,
+        get_read_replicas,
+        get_async_read_replicas,
+    ):
+        cached.cache_clear()
@@ -1,10 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app import models, schemas
+from app.cache import get_user_cache, has_recent_write
+from app.database import get_async_db, get_async_read_replicas, get_db, get_read_replicas
 from app.security import decode_access_token
-from app.service import UserService
+from app.service import AsyncUserService, UserService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -15,6 +18,62 @@ def get_current_user(
 ):
     """Resolve the currently authenticated user from the JWT."""
 
+    email = _token_subject(token)
+    user = get_user_cache().get(email)
+    if user is None:
+        user_service = UserService(db)
+        user = _remember(email, user_service.get_by_email(email))
+    return _ensure_active(user)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async counterpart of :func:`get_current_user` for the async request path."""
+
+    email = _token_subject(token)
+    user = get_user_cache().get(email)
+    if user is None:
+        user_service = AsyncUserService(db)
+        user = _remember(email, await user_service.get_by_email(email))
+    return _ensure_active(user)
+
+
+def get_read_db(
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Yield a session on a read replica, or the primary session ``db``.
+
+    Reads stay on the primary when no replica is configured or when the user wrote
+    within the read-your-writes window. Sessions connect lazily, so the unused primary
+    session costs nothing.
+    """
+
+    replicas = get_read_replicas()
+    if not replicas or has_recent_write(current_user.id):
+        yield db
+        return
+    with replicas.next()() as replica_db:
+        yield replica_db
+
+
+async def get_async_read_db(
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Async counterpart of :func:`get_read_db`."""
+
+    replicas = get_async_read_replicas()
+    if not replicas or has_recent_write(current_user.id):
+        yield db
+        return
+    async with replicas.next()() as replica_db:
+        yield replica_db
+
+
+def _token_subject(token: str) -> str:
     try:
         payload = decode_access_token(token)
     except ValueError as exc:  # pragma: no cover - defensive hardening
@@ -26,9 +85,19 @@ def get_current_user(
     email: str | None = payload.get("sub")
     if email is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
+    return email
+
+
+def _remember(email: str, user: models.User | None) -> schemas.AuthenticatedUser | None:
+    # Only resolved users are cached; unknown subjects keep hitting the database.
+    if user is None:
+        return None
+    authenticated = schemas.AuthenticatedUser.model_validate(user)
+    get_user_cache().set(email, authenticated)
+    return authenticated
+
 
-    user_service = UserService(db)
-    user = user_service.get_by_email(email)
+def _ensure_active(user: schemas.AuthenticatedUser | None) -> schemas.AuthenticatedUser:
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
@@ -0,0 +1,104 @@
+import csv
+import io
+from collections.abc import AsyncIterable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Literal
+
+from fastapi.responses import StreamingResponse
+
+from app import models, schemas
+
+EXPORT_FIELDS = list(schemas.ProjectRead.model_fields)
+EXPORT_CHUNK_ROWS = 200
+
+
+def ndjson_chunk(projects: Sequence[models.Project]) -> bytes:
+    """Encode a batch of projects as newline-delimited JSON."""
+
+    buffer = bytearray()
+    for project in projects:
+        buffer += schemas.ProjectRead.model_validate(project).model_dump_json().encode("utf-8")
+        buffer += b"\n"
+    return bytes(buffer)
+
+
+def csv_header() -> bytes:
+    """Encode the CSV header row shared by every export."""
+
+    return _csv_encode([EXPORT_FIELDS])
+
+
+def csv_chunk(projects: Sequence[models.Project]) -> bytes:
+    """Encode a batch of projects as CSV rows, without a header."""
+
+    rows = []
+    for project in projects:
+        record = schemas.ProjectRead.model_validate(project).model_dump(mode="json")
+        rows.append([record[field] for field in EXPORT_FIELDS])
+    return _csv_encode(rows)
+
+
+def ndjson_chunks(
+    projects: Iterable[models.Project],
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """Serialize projects as newline-delimited JSON, a bounded chunk at a time."""
+
+    for batch in _batched(projects, chunk_rows):
+        yield ndjson_chunk(batch)
+
+
+def csv_chunks(
+    projects: Iterable[models.Project],
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """Serialize projects as CSV with a header row, a bounded chunk at a time."""
+
+    # Send the header straight away so clients see the first byte before any rows load.
+    yield csv_header()
+    for batch in _batched(projects, chunk_rows):
+        yield csv_chunk(batch)
+
+
+async def async_ndjson_chunks(batches: AsyncIterable[Sequence[models.Project]]):
+    """Async counterpart of :func:`ndjson_chunks` over batches of projects."""
+
+    async for batch in batches:
+        if batch:
+            yield ndjson_chunk(batch)
+
+
+async def async_csv_chunks(batches: AsyncIterable[Sequence[models.Project]]):
+    """Async counterpart of :func:`csv_chunks` over batches of projects."""
+
+    yield csv_header()
+    async for batch in batches:
+        if batch:
+            yield csv_chunk(batch)
+
+
+def export_response(
+    chunks: Iterable[bytes] | AsyncIterable[bytes],
+    export_format: Literal["ndjson", "csv"],
+) -> StreamingResponse:
+    """Stream export ``chunks`` with the media type and headers of ``export_format``."""
+
+    if export_format == "csv":
+        return StreamingResponse(
+            chunks,
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="projects.csv"'},
+        )
+    return StreamingResponse(chunks, media_type="application/x-ndjson")
+
+
+def _batched(items: Iterable[models.Project], size: int) -> Iterator[list[models.Project]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _csv_encode(rows: Iterable[Sequence[object]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,113 @@
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha256
+
+from fastapi import Request, Response, status
+
+_PROJECT_ETAG = re.compile(r'"p(?P<project_id>\d+)-(?P<micros>\d+)"')
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def project_etag(project_id: int, updated_at: datetime) -> str:
+    """Strong validator for a single project, derived from its id and ``updated_at``."""
+
+    return f'"p{project_id}-{_epoch_micros(updated_at)}"'
+
+
+def list_etag(
+    owner_id: int,
+    count: int,
+    last_modified: datetime | None,
+    *parameters: object,
+) -> str:
+    """Strong validator for an owner's project list, derived from its aggregate state.
+
+    Any insert, update or delete changes either the row count or ``max(updated_at)``;
+    ``parameters`` distinguishes different pages and representations of the same list.
+    """
+
+    stamp = _epoch_micros(last_modified) if last_modified is not None else 0
+    raw = ":".join(str(part) for part in (owner_id, count, stamp, *parameters))
+    return f'"l{sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime | None) -> Response | None:
+    """Return a 304 response when the request's validators still match, else ``None``."""
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _matches(if_none_match, etag, weak=True)
+    else:
+        fresh = _not_modified_since(request.headers.get("if-modified-since"), last_modified)
+    if not fresh:
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+
+def if_match_versions(request: Request, project_id: int) -> list[datetime] | None:
+    """``updated_at`` values an ``If-Match`` header accepts for ``project_id``.
+
+    ``None`` means any version will do (no header, or ``*``). Otherwise the write must
+    only apply while the row still has one of the returned versions; an empty list
+    matches nothing. Weak and foreign tags never match, as If-Match compares strongly.
+    """
+
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return None
+    versions = []
+    for candidate in (part.strip() for part in if_match.split(",")):
+        if candidate == "*":
+            return None
+        match = _PROJECT_ETAG.fullmatch(candidate)
+        if match is not None and int(match["project_id"]) == project_id:
+            versions.append(_EPOCH + timedelta(microseconds=int(match["micros"])))
+    return versions
+
+
+def _matches(header: str, etag: str, weak: bool) -> bool:
+    for candidate in (part.strip() for part in header.split(",")):
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            # Weak validators never satisfy the strong comparison If-Match requires.
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def _not_modified_since(header: str | None, last_modified: datetime | None) -> bool:
+    if header is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    # HTTP dates carry whole seconds only.
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive timestamps; they are stored in UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _epoch_micros(value: datetime) -> int:
+    delta = _as_utc(value) - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
@@ -1,27 +1,114 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Any
 
-from app.config import get_settings
-from app.views import auth_router, project_router
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 
+from app import database
+from app.cache import get_project_cache, get_user_cache
+from app.config import Settings, get_settings
+from app.metrics import MetricsMiddleware, get_metrics_registry, install_query_hooks
+from app.pool import pool_status, statement_cache_status
+from app.security import PasswordHashingBusy, get_token_cache
 
-def create_app() -> FastAPI:
+
+def create_app(settings: Settings | None = None) -> FastAPI:
     """Application factory used across run targets."""
 
-    settings = get_settings()
-    application = FastAPI(title=settings.app_name, debug=settings.debug)
+    settings = settings or get_settings()
+
+    @asynccontextmanager
+    async def lifespan(application: FastAPI):
+        # Engines are built here rather than at import time, so importing the app stays
+        # cheap. Optionally open a few connections before the worker takes traffic.
+        await _warm_up(settings)
+        yield
+        await database.dispose_engines()
+
+    application = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
+    application.state.settings = settings
+
+    # DB_ASYNC selects coroutine handlers on AsyncSession instead of threadpool handlers.
+    # Only the selected module is imported.
+    if settings.db_async:
+        from app import async_views as routes
+    else:
+        from app import views as routes
+    application.include_router(routes.auth_router)
+    application.include_router(routes.project_router)
+
+    @application.exception_handler(PasswordHashingBusy)
+    async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Authentication is temporarily overloaded, retry shortly"},
+            headers={"Retry-After": str(settings.password_hash_retry_after_seconds)},
+        )
+
+    @application.get("/health", tags=["health"])
+    def healthcheck():
+        """Simple endpoint to monitor service health."""
 
-    application.include_router(auth_router)
-    application.include_router(project_router)
+        return {"status": "ok", "environment": settings.environment}
+
+    if settings.metrics_enabled:
+        _enable_metrics(application, settings)
 
     return application
 
 
-app = create_app()
+async def _warm_up(settings: Settings) -> None:
+    if settings.db_async:
+        async_engine = database.get_async_sessionmaker().kw["bind"]
+        connections = [await async_engine.connect() for _ in range(settings.db_warm_connections)]
+        for connection in connections:
+            await connection.close()
+        return
+
+    engine = database.get_engine()
+
+    def connect_all() -> None:
+        connections = [engine.connect() for _ in range(settings.db_warm_connections)]
+        for connection in connections:
+            connection.close()
+
+    if settings.db_warm_connections:
+        await run_in_threadpool(connect_all)
+
+
+def _enable_metrics(application: FastAPI, settings: Settings) -> None:
+    install_query_hooks()
+    application.add_middleware(
+        MetricsMiddleware,
+        slow_request_ms=settings.slow_request_ms,
+        max_statements=settings.slow_request_log_max_statements,
+    )
 
+    @application.get("/metrics", include_in_schema=False)
+    def metrics():
+        engines = {"sync": database.get_engine()}
+        if database.get_async_sessionmaker.cache_info().currsize:
+            engines["async"] = database.get_async_sessionmaker().kw["bind"].sync_engine
+        pools = {name: pool_status(engine) for name, engine in engines.items()}
+        statement_caches = {
+            name: statement_cache_status(engine) for name, engine in engines.items()
+        }
+        caches = {
+            "token": get_token_cache().stats(),
+            "user": get_user_cache().stats(),
+            "project": get_project_cache().stats(),
+        }
+        return PlainTextResponse(
+            get_metrics_registry().render(pools, statement_caches, caches),
+            media_type="text/plain; version=0.0.4",
+        )
 
-@app.get("/health", tags=["health"])
-def healthcheck():
-    """Simple endpoint to monitor service health."""
 
-    settings = get_settings()
-    return {"status": "ok", "environment": settings.environment}
+def __getattr__(name: str) -> Any:
+    # ``uvicorn app.main:app`` still works, but the app is only built when asked for.
+    if name == "app":
+        application = create_app()
+        globals()["app"] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,240 @@
+import bisect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram over fixed upper bounds."""
+
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        total = 0
+        result = []
+        for bound, count in zip((*map(_format_bound, self.buckets), "+Inf"), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class RequestStats:
+    """Database work done while serving one request."""
+
+    def __init__(self, max_statements: int):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements: list[str] = []
+        self._max_statements = max_statements
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+        if len(self.statements) < self._max_statements:
+            self.statements.append(statement)
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+class MetricsRegistry:
+    """Process-wide request and database metrics rendered in Prometheus text format."""
+
+    def __init__(self) -> None:
+        self.requests: dict[tuple[str, str, str], int] = {}
+        self.latency: dict[tuple[str, str], Histogram] = {}
+        self.db_latency: dict[tuple[str, str], Histogram] = {}
+        self.db_queries: dict[tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status_code: int,
+        seconds: float,
+        stats: RequestStats,
+    ) -> None:
+        key = (method, route)
+        with self._lock:
+            status_key = (method, route, str(status_code))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            self.latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+            self.db_latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(stats.db_seconds)
+            self.db_queries.setdefault(key, Histogram(QUERY_COUNT_BUCKETS)).observe(stats.queries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.latency.clear()
+            self.db_latency.clear()
+            self.db_queries.clear()
+
+    def render(
+        self,
+        pools: Optional[dict[str, dict[str, Any]]] = None,
+        statement_caches: Optional[dict[str, dict[str, Any]]] = None,
+        caches: Optional[dict[str, dict[str, Any]]] = None,
+    ) -> str:
+        lines: list[str] = []
+        with self._lock:
+            lines += [
+                "# HELP http_requests_total Requests served, by route and status code.",
+                "# TYPE http_requests_total counter",
+            ]
+            for (method, route, code), value in sorted(self.requests.items()):
+                labels = _labels(method=method, route=route, status=code)
+                lines.append(f"http_requests_total{labels} {value}")
+            for name, help_text, histograms in (
+                ("http_request_duration_seconds", "Request latency.", self.latency),
+                ("http_request_db_seconds", "Database time per request.", self.db_latency),
+                ("http_request_db_queries", "Statements executed per request.", self.db_queries),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (method, route), histogram in sorted(histograms.items()):
+                    lines += _histogram_lines(name, histogram, method=method, route=route)
+        for pool_name, stats in (pools or {}).items():
+            for stat, value in stats.items():
+                lines.append(f"db_pool_{stat}{_labels(pool=pool_name)} {value}")
+        for engine_name, stats in (statement_caches or {}).items():
+            for stat, value in stats.items():
+                lines.append(f"db_statement_cache_{stat}{_labels(pool=engine_name)} {value}")
+        for cache_name, stats in (caches or {}).items():
+            for stat, value in stats.items():
+                lines.append(f"cache_{stat}{_labels(cache=cache_name)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide metrics registry."""
+
+    return MetricsRegistry()
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request and collecting its database work.
+
+    Requests slower than ``slow_request_ms`` are logged with the statements they ran.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        slow_request_ms: Optional[float] = None,
+        max_statements: int = 50,
+    ):
+        self.app = app
+        self.slow_request_ms = slow_request_ms
+        self.max_statements = max_statements
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats(self.max_statements)
+        token = _request_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _request_stats.reset(token)
+            # Label by route template, not raw path, to keep the series bounded.
+            route = getattr(scope.get("route"), "path", "unmatched")
+            get_metrics_registry().observe_request(
+                scope["method"], route, status_code, elapsed, stats
+            )
+            if self.slow_request_ms is not None and elapsed * 1000 >= self.slow_request_ms:
+                logger.warning(
+                    "slow request %s %s: %.1f ms, %d queries, %.1f ms in db\n%s",
+                    scope["method"],
+                    route,
+                    elapsed * 1000,
+                    stats.queries,
+                    stats.db_seconds * 1000,
+                    "\n".join(stats.statements),
+                )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute; count them here instead.
+    connection = exception_context.connection
+    started_at = connection.info.get("query_started_at") if connection is not None else None
+    if started_at:
+        started = started_at.pop()
+        stats = _request_stats.get()
+        if stats is not None and exception_context.statement is not None:
+            stats.record(exception_context.statement, time.perf_counter() - started)
+
+
+def install_query_hooks() -> None:
+    """Count statements and database time per request on every engine in the process."""
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, histogram: Histogram, **labels: str) -> list[str]:
+    lines = [
+        f"{name}_bucket{_labels(**labels, le=bound)} {count}"
+        for bound, count in histogram.cumulative()
+    ]
+    lines.append(f"{name}_sum{_labels(**labels)} {histogram.sum}")
+    lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+    return lines
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
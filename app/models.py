@@ -1,7 +1,20 @@
 from datetime import date, datetime
 from typing import List
 
-from sqlalchemy import Boolean, Date, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -46,7 +59,7 @@ class Project(TimestampMixin, Base):
 
     __tablename__ = "projects"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     expiration_date: Mapped[date] = mapped_column(Date, nullable=False)
@@ -58,3 +71,162 @@ class Project(TimestampMixin, Base):
     )
 
     owner: Mapped[User] = relationship("User", back_populates="projects")
+
+    # After ``python -m app.partitioning swap`` the table's key is (id, owner_id), as
+    # Postgres requires the partition key in it; projects are still identified by id.
+    __mapper_args__ = {"primary_key": [id]}
+
+
+# Serves owner-scoped listings in keyset order without sorting the owner's rows.
+Index(
+    "ix_projects_owner_id_created_at_id",
+    Project.owner_id,
+    Project.created_at.desc(),
+    Project.id.desc(),
+)
+
+# Serves the owner-scoped expiring listing as a range scan in expiration order.
+Index(
+    "ix_projects_owner_id_expiration_date",
+    Project.owner_id,
+    Project.expiration_date,
+    Project.id,
+)
+
+# Lets the expiration sweeper walk every owner's expired rows in keyset batches.
+Index("ix_projects_expiration_date_id", Project.expiration_date, Project.id)
+
+
+# Full-text document for search. Literals are inlined so the query expression renders
+# exactly like the index expression and Postgres can match the two.
+project_search_document = func.to_tsvector(
+    literal_column("'simple'"),
+    func.coalesce(Project.name, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Project.description, literal_column("''")),
+)
+
+Index(
+    "ix_projects_search_document",
+    project_search_document,
+    postgresql_using="gin",
+    # The leading literal hides the table from Index's column discovery.
+    _table=Project.__table__,
+).ddl_if(dialect="postgresql")
+
+Index(
+    "ix_projects_name_trgm",
+    Project.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+# SQLite has no tsvector; an external-content FTS5 table kept in sync by triggers
+# stands in so the in-memory test database can exercise search.
+for statement in (
+    """
+    CREATE VIRTUAL TABLE projects_fts USING fts5(
+        name, description, content='projects', content_rowid='id'
+    )
+    """,
+    """
+    CREATE TRIGGER projects_fts_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO projects_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER projects_fts_delete AFTER DELETE ON projects BEGIN
+        INSERT INTO projects_fts (projects_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER projects_fts_update AFTER UPDATE ON projects BEGIN
+        INSERT INTO projects_fts (projects_fts, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO projects_fts (rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+):
+    event.listen(Project.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    Project.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS projects_fts").execute_if(dialect="sqlite"),
+)
+
+
+class ProjectExpirationCount(Base):
+    """Number of projects per owner and expiration date, kept current by every project write.
+
+    Rows with a negative ``owner_id`` are shards of the totals across owners, see
+    :func:`app.stats.all_owners_shard`.
+    """
+
+    __tablename__ = "project_expiration_counts"
+
+    owner_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    expiration_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    project_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class ArchivedProject(Base):
+    """Project moved out of ``projects`` by the archiver once it expired past retention.
+
+    Keeps the original id and timestamps, so a project reads the same after the move.
+    """
+
+    __tablename__ = "projects_archive"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    expiration_date: Mapped[date] = mapped_column(Date, nullable=False)
+    owner_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+
+# Owner-scoped archive listing, most recently expired first.
+Index(
+    "ix_projects_archive_owner_id_expiration_date_id",
+    ArchivedProject.owner_id,
+    ArchivedProject.expiration_date.desc(),
+    ArchivedProject.id.desc(),
+)
+
+
+class ProjectImport(Base):
+    """Progress of a resumable bulk import, committed together with each loaded batch."""
+
+    __tablename__ = "project_imports"
+
+    import_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    records_done: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_loaded: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_rejected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import date, datetime
+
+
+def encode_cursor(created_at: datetime, project_id: int) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+
+    return _encode([created_at.isoformat(), project_id])
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+
+    try:
+        created_at, project_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), int(project_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def encode_expiration_cursor(expiration_date: date, project_id: int) -> str:
+    """Encode a position in expiration order as an opaque, URL-safe cursor."""
+
+    return _encode([expiration_date.isoformat(), project_id])
+
+
+def decode_expiration_cursor(cursor: str) -> tuple[date, int]:
+    """Decode a cursor produced by :func:`encode_expiration_cursor`."""
+
+    try:
+        expiration_date, project_id = _decode(cursor)
+        return date.fromisoformat(expiration_date), int(project_id)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def _encode(position: list) -> str:
+    raw = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
@@ -0,0 +1,352 @@
+"""Online move of ``projects`` onto hash partitions by owner_id (Postgres).
+
+    python -m app.partitioning prepare --partitions 32   # mirrored projects_partitioned
+    python -m app.partitioning backfill                  # copy existing rows in keyset batches
+    python -m app.partitioning swap                      # rename tables in one short transaction
+    python -m app.partitioning check --owner-id 42 --project-id 7
+
+``cancel`` drops the mirrored table and its trigger again, as long as ``swap`` has not run.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Iterable, NamedTuple, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import delete, event, text, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import get_sessionmaker
+from app.service import ProjectService
+
+logger = logging.getLogger(__name__)
+
+SHADOW_TABLE = "projects_partitioned"
+
+# Created on the shadow table with a ``_new`` suffix; the swap gives them these names.
+INDEXES = (
+    ("ix_projects_id", "(id)"),
+    ("ix_projects_name", "(name)"),
+    ("ix_projects_owner_id", "(owner_id)"),
+    ("ix_projects_owner_id_created_at_id", "(owner_id, created_at DESC, id DESC)"),
+    ("ix_projects_owner_id_expiration_date", "(owner_id, expiration_date, id)"),
+    ("ix_projects_expiration_date_id", "(expiration_date, id)"),
+    (
+        "ix_projects_search_document",
+        "USING gin (to_tsvector('simple', "
+        "coalesce(name, '') || ' ' || coalesce(description, '')))",
+    ),
+    ("ix_projects_name_trgm", "USING gin (name gin_trgm_ops)"),
+)
+
+
+def project_partitions_ddl(table: str, partitions: int) -> list[str]:
+    """``CREATE TABLE ... PARTITION OF`` statements for ``partitions`` hash partitions."""
+
+    return [
+        f"CREATE TABLE projects_p{remainder} PARTITION OF {table} "
+        f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        for remainder in range(partitions)
+    ]
+
+
+def prepare(db: Session, partitions: int) -> None:
+    """Create ``projects_partitioned`` with ``partitions`` hash partitions and mirror writes into it.
+
+    A trigger on ``projects`` copies every insert, update and delete, so the copy stays
+    current while :func:`backfill` runs. The partition count is fixed from here on.
+    """
+
+    if db.get_bind().dialect.name != "postgresql":
+        raise RuntimeError("hash partitioning needs Postgres")
+    if partitions < 2:
+        raise ValueError("--partitions must be at least 2")
+    if db.scalar(text("SELECT to_regclass(:table)"), {"table": SHADOW_TABLE}) is not None:
+        raise RuntimeError(f"{SHADOW_TABLE} already exists; run cancel first to start over")
+
+    statements = [
+        f"""
+        CREATE TABLE {SHADOW_TABLE} (
+            LIKE projects INCLUDING DEFAULTS,
+            PRIMARY KEY (id, owner_id),
+            FOREIGN KEY (owner_id) REFERENCES users (id) ON DELETE CASCADE
+        ) PARTITION BY HASH (owner_id)
+        """,
+        *project_partitions_ddl(SHADOW_TABLE, partitions),
+        *(
+            f"CREATE INDEX {name}_new ON {SHADOW_TABLE} {definition}"
+            for name, definition in INDEXES
+        ),
+        # The upsert tolerates rows the backfill copied first.
+        f"""
+        CREATE FUNCTION projects_mirror() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM {SHADOW_TABLE} WHERE id = OLD.id AND owner_id = OLD.owner_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO {SHADOW_TABLE} SELECT NEW.*
+                ON CONFLICT (id, owner_id) DO UPDATE SET
+                    name = EXCLUDED.name,
+                    description = EXCLUDED.description,
+                    expiration_date = EXCLUDED.expiration_date,
+                    created_at = EXCLUDED.created_at,
+                    updated_at = EXCLUDED.updated_at;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER projects_mirror AFTER INSERT OR UPDATE OR DELETE ON projects
+        FOR EACH ROW EXECUTE FUNCTION projects_mirror()
+        """,
+    ]
+    for statement in statements:
+        db.execute(text(statement))
+    db.commit()
+
+
+def cancel(db: Session) -> None:
+    """Drop the mirror trigger and ``projects_partitioned``; only valid before :func:`swap`."""
+
+    for statement in (
+        "DROP TRIGGER IF EXISTS projects_mirror ON projects",
+        "DROP FUNCTION IF EXISTS projects_mirror()",
+        f"DROP TABLE IF EXISTS {SHADOW_TABLE}",
+    ):
+        db.execute(text(statement))
+    db.commit()
+
+
+class BackfillReport(NamedTuple):
+    copied: int
+    batches: int
+    seconds: float
+
+
+def backfill(db: Session, batch_size: int = 10_000) -> BackfillReport:
+    """Copy ``projects`` into the partitioned table in ``id`` order, one commit per batch.
+
+    Source rows are read ``FOR SHARE``, so a concurrent update or delete of a row being
+    copied waits for the batch and is then mirrored by the trigger. Rows the trigger
+    already copied are skipped, which also makes the backfill safe to rerun.
+    """
+
+    copied = batches = 0
+    last_id = 0
+    started = time.perf_counter()
+    while True:
+        upto = db.scalar(
+            text(
+                "SELECT max(id) FROM "
+                "(SELECT id FROM projects WHERE id > :after ORDER BY id LIMIT :n) batch"
+            ),
+            {"after": last_id, "n": batch_size},
+        )
+        if upto is None:
+            db.commit()
+            break
+        result = db.execute(
+            text(
+                f"INSERT INTO {SHADOW_TABLE} "
+                "SELECT * FROM projects WHERE id > :after AND id <= :upto FOR SHARE "
+                "ON CONFLICT (id, owner_id) DO NOTHING"
+            ),
+            {"after": last_id, "upto": upto},
+        )
+        db.commit()
+        copied += result.rowcount
+        batches += 1
+        last_id = upto
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "batch %d: up to id %d, %d rows copied (%.0f rows/s)",
+            batches,
+            last_id,
+            copied,
+            copied / elapsed if elapsed > 0 else 0.0,
+        )
+    return BackfillReport(copied, batches, time.perf_counter() - started)
+
+
+def swap(db: Session, lock_timeout: str = "5s") -> None:
+    """Make the partitioned table ``projects`` and keep the old one as ``projects_unpartitioned``.
+
+    Everything runs in one transaction under an ``ACCESS EXCLUSIVE`` lock on ``projects``.
+    ``lock_timeout`` makes it give up instead of queueing traffic behind a long transaction.
+    """
+
+    db.execute(text(f"SET LOCAL lock_timeout = '{lock_timeout}'"))
+    db.execute(text("LOCK TABLE projects IN ACCESS EXCLUSIVE MODE"))
+    missing = db.scalar(
+        text(
+            f"SELECT count(*) FROM (SELECT id, owner_id FROM projects "
+            f"EXCEPT SELECT id, owner_id FROM {SHADOW_TABLE}) m"
+        )
+    )
+    if missing:
+        db.rollback()
+        raise RuntimeError(f"{missing} projects are not copied yet; run the backfill first")
+
+    new_indexes = db.scalars(
+        text(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE tablename = :table AND indexname LIKE '%\\_new'"
+        ),
+        {"table": SHADOW_TABLE},
+    ).all()
+    statements = [
+        "DROP TRIGGER projects_mirror ON projects",
+        "DROP FUNCTION projects_mirror()",
+        "ALTER TABLE projects RENAME TO projects_unpartitioned",
+        "ALTER TABLE projects_unpartitioned RENAME CONSTRAINT projects_pkey "
+        "TO projects_unpartitioned_pkey",
+    ]
+    for new_index in new_indexes:
+        name = new_index.removesuffix("_new")
+        statements += [
+            f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_unpartitioned",
+            f"ALTER INDEX {new_index} RENAME TO {name}",
+        ]
+    statements += [
+        f"ALTER TABLE {SHADOW_TABLE} RENAME TO projects",
+        f"ALTER TABLE projects RENAME CONSTRAINT {SHADOW_TABLE}_pkey TO projects_pkey",
+        "ALTER SEQUENCE projects_id_seq OWNED BY projects.id",
+    ]
+    for statement in statements:
+        db.execute(text(statement))
+    db.commit()
+
+
+def partitions_in_plan(plan: Any) -> set[str]:
+    """Names of the ``projects`` partitions an ``EXPLAIN (FORMAT JSON)`` plan touches."""
+
+    found: set[str] = set()
+    nodes: list[Any] = [plan]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, list):
+            nodes.extend(node)
+        elif isinstance(node, dict):
+            relation = node.get("Relation Name", "")
+            if relation.startswith("projects_p"):
+                found.add(relation)
+            nodes.extend(node.values())
+    return found
+
+
+def check_pruning(db: Session, owner_id: int, project_id: int) -> dict[str, set[str]]:
+    """EXPLAIN the owner-scoped project queries and return the partitions each one scans.
+
+    Reads go through :class:`ProjectService` and the SQL it sends is captured and
+    explained with the same parameters. Writes are explained from statements of the same
+    shape, since running them would modify data. Every entry should name one partition.
+    """
+
+    captured: list[tuple[str, Any]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().startswith("SELECT"):
+            return
+        if "projects" in statement:
+            captured.append((statement, parameters))
+
+    connection = db.connection()
+    event.listen(connection, "before_cursor_execute", capture)
+    service = ProjectService(db)
+    try:
+        calls = {
+            "fetch_projects_page": lambda: service.fetch_projects_page(owner_id, 100),
+            "get_project": lambda: service.get_project(project_id, owner_id),
+            "get_project_version": lambda: service.get_project_version(project_id, owner_id),
+            "list_projects_version": lambda: service.list_projects_version(owner_id),
+            "list_expiring_projects": lambda: service.list_expiring_projects(owner_id, 30),
+            "search_projects": lambda: service.search_projects(owner_id, "report"),
+        }
+        statements: dict[str, tuple[str, Any]] = {}
+        for label, call in calls.items():
+            captured.clear()
+            try:
+                call()
+            except HTTPException:
+                pass  # a missing project still ran its query
+            for index, entry in enumerate(captured):
+                statements[label if index == 0 else f"{label}[{index}]"] = entry
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    dialect = postgresql.dialect()
+    writes = {
+        "update_project": update(models.Project)
+        .where(models.Project.id == project_id, models.Project.owner_id == owner_id)
+        .values(name="pruning check"),
+        "delete_project": delete(models.Project).where(
+            models.Project.id == project_id, models.Project.owner_id == owner_id
+        ),
+    }
+    for label, stmt in writes.items():
+        compiled = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        statements[label] = (str(compiled), None)
+
+    scanned = {}
+    for label, (statement, parameters) in statements.items():
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        raw = plan.scalar()
+        scanned[label] = partitions_in_plan(json.loads(raw) if isinstance(raw, str) else raw)
+    db.rollback()
+    return scanned
+
+
+def main(argv: Optional[Iterable[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    prepare_parser = commands.add_parser("prepare", help="create the mirrored partitioned table")
+    prepare_parser.add_argument("--partitions", type=int, required=True)
+    commands.add_parser("cancel", help="drop the partitioned copy before the swap")
+    backfill_parser = commands.add_parser("backfill", help="copy existing rows")
+    backfill_parser.add_argument("--batch-size", type=int, default=10_000)
+    swap_parser = commands.add_parser("swap", help="switch to the partitioned table")
+    swap_parser.add_argument("--lock-timeout", default="5s")
+    check_parser = commands.add_parser("check", help="confirm queries prune to one partition")
+    check_parser.add_argument("--owner-id", type=int, required=True)
+    check_parser.add_argument("--project-id", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with get_sessionmaker()() as db:
+        if args.command == "prepare":
+            prepare(db, args.partitions)
+            logger.info("%s created with %d partitions", SHADOW_TABLE, args.partitions)
+        elif args.command == "cancel":
+            cancel(db)
+            logger.info("%s and its mirror trigger dropped", SHADOW_TABLE)
+        elif args.command == "backfill":
+            report = backfill(db, args.batch_size)
+            logger.info(
+                "done: %d rows copied in %d batches, %.1fs",
+                report.copied,
+                report.batches,
+                report.seconds,
+            )
+        elif args.command == "swap":
+            swap(db, args.lock_timeout)
+            logger.info("projects is now partitioned; old table kept as projects_unpartitioned")
+        else:
+            scanned = check_pruning(db, args.owner_id, args.project_id)
+            for label, partitions in scanned.items():
+                logger.info("%-28s %s", label, ", ".join(sorted(partitions)) or "-")
+            if any(len(partitions) > 1 for partitions in scanned.values()):
+                logger.error("some queries scan more than one partition")
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
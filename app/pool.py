@@ -0,0 +1,186 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolStats:
+    """Counters for one connection pool, fed by pool events and timed checkouts."""
+
+    def __init__(self) -> None:
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.in_use = 0
+        self.in_use_max = 0
+        self._lock = threading.Lock()
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.in_use_max = max(self.in_use_max, self.in_use)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.in_use = max(self.in_use - 1, 0)
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        with self._lock:
+            stats: dict[str, Any] = {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "wait_seconds_avg": (
+                    self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+                ),
+                "in_use": self.in_use,
+                "in_use_max": self.in_use_max,
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(size=pool.size(), idle=pool.checkedin(), overflow=pool.overflow())
+        return stats
+
+
+class StatementCacheStats:
+    """How often an engine's statements were served from its compiled-SQL cache."""
+
+    def __init__(self) -> None:
+        self.outcomes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    def snapshot(self, engine: Engine) -> dict[str, Any]:
+        with self._lock:
+            hits = self.outcomes.get("cache_hit", 0)
+            misses = self.outcomes.get("cache_miss", 0)
+            stats: dict[str, Any] = {
+                "hits": hits,
+                "misses": misses,
+                # Statements SQLAlchemy could not cache at all, e.g. text() or DDL.
+                "uncached": sum(self.outcomes.values()) - hits - misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+            }
+        compiled_cache = getattr(engine, "_compiled_cache", None)
+        if compiled_cache is not None:
+            stats.update(size=len(compiled_cache), capacity=compiled_cache.capacity)
+        return stats
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that times how long each checkout waits for a connection.
+
+    The wait includes queueing for a free slot, opening an overflow connection and the
+    pre-ping, i.e. everything a request spends before it can issue its first statement.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self) -> QueuePool:
+        # Engine.dispose() swaps in a fresh pool; keep the counters across it.
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Async-driver variant of :class:`InstrumentedQueuePool`."""
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Count connects, checkouts, checkins and invalidations on ``engine``'s pool.
+
+    Also records whether each statement's SQL came from the compiled cache; see
+    :func:`statement_cache_status`.
+    """
+
+    engine.statement_cache_stats = StatementCacheStats()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            engine.statement_cache_stats.record(context.cache_hit.name.lower())
+
+    def stats() -> PoolStats | None:
+        # Looked up per event because Engine.dispose() replaces the pool object.
+        return getattr(engine.pool, "stats", None)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        if (pool_stats := stats()) is not None:
+            pool_stats.record_connect()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        if (pool_stats := stats()) is not None:
+            pool_stats.record_checkout()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        if (pool_stats := stats()) is not None:
+            pool_stats.record_checkin()
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        if (pool_stats := stats()) is not None:
+            pool_stats.record_invalidation()
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Return counters and current occupancy for ``engine``'s pool, if it is instrumented."""
+
+    pool_stats: PoolStats | None = getattr(engine.pool, "stats", None)
+    if pool_stats is None:
+        return {}
+    return pool_stats.snapshot(engine.pool)
+
+
+def statement_cache_status(engine: Engine) -> dict[str, Any]:
+    """Return compiled-cache hits, misses and occupancy for an instrumented ``engine``."""
+
+    cache_stats: StatementCacheStats | None = getattr(engine, "statement_cache_stats", None)
+    if cache_stats is None:
+        return {}
+    return cache_stats.snapshot(engine)
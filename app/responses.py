@@ -0,0 +1,70 @@
+from typing import Any, List, Optional
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.config import get_settings
+from app.http_cache import project_etag, validator_headers
+
+PROJECT = TypeAdapter(schemas.ProjectRead)
+PROJECT_LIST = TypeAdapter(List[schemas.ProjectRead])
+BULK_RESULTS = TypeAdapter(List[schemas.ProjectBulkResult])
+ARCHIVED_PROJECT_LIST = TypeAdapter(List[schemas.ArchivedProjectRead])
+
+
+def json_response(
+    request: Request,
+    response: Response,
+    adapter: TypeAdapter,
+    content: Any,
+    status_code: int = status.HTTP_200_OK,
+) -> Any:
+    """Serialize already-validated ``content`` straight to JSON bytes when enabled.
+
+    Returning a ``Response`` skips FastAPI's ``response_model`` pass, which re-validates
+    every item and then encodes it a second time with the stdlib encoder. ``content``
+    must already match ``adapter``'s type. Headers set on the injected ``response`` are
+    carried over. With ``FAST_JSON_RESPONSES`` off, ``content`` is returned for FastAPI
+    to serialize as usual.
+    """
+
+    settings = getattr(request.app.state, "settings", None) or get_settings()
+    if not settings.fast_json_responses:
+        return content
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        headers=dict(response.headers),
+        media_type="application/json",
+    )
+
+
+def project_response(
+    request: Request,
+    response: Response,
+    project: Any,
+    status_code: int = status.HTTP_200_OK,
+) -> Any:
+    """Serialize one project along with its ``ETag`` and ``Last-Modified`` validators."""
+
+    project = schemas.ProjectRead.model_validate(project)
+    response.headers.update(
+        validator_headers(project_etag(project.id, project.updated_at), project.updated_at)
+    )
+    return json_response(request, response, PROJECT, project, status_code)
+
+
+def page_response(
+    request: Request,
+    response: Response,
+    adapter: TypeAdapter,
+    items: Any,
+    next_page: Optional[str | int],
+    header: str = "X-Next-Cursor",
+) -> Any:
+    """Serialize one page of a listing, pointing at the next page in ``header`` if any."""
+
+    if next_page is not None:
+        response.headers[header] = str(next_page)
+    return json_response(request, response, adapter, items)
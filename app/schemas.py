@@ -1,7 +1,7 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 
 
 class UserBase(BaseModel):
@@ -22,6 +22,16 @@ class UserRead(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class AuthenticatedUser(BaseModel):
+    """Authorization-relevant subset of a user, safe to cache across requests."""
+
+    id: int
+    email: str
+    is_active: bool
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
@@ -47,6 +57,14 @@ class ProjectUpdate(BaseModel):
     description: Optional[str] = None
     expiration_date: Optional[date] = None
 
+    @field_validator("name", "expiration_date")
+    @classmethod
+    def reject_null(cls, value):
+        # Omit a field to leave it unchanged; an explicit null would violate NOT NULL.
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
 
 class ProjectRead(ProjectBase):
     id: int
@@ -55,3 +73,31 @@ class ProjectRead(ProjectBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ArchivedProjectRead(ProjectRead):
+    archived_at: datetime
+
+
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+
+
+class ProjectBulkResult(BaseModel):
+    id: int
+    status: Literal["created", "updated", "deleted", "not_found"]
+    project: Optional[ProjectRead] = None
+
+
+class ExpirationBuckets(BaseModel):
+    expired: int = 0
+    within_7_days: int = 0
+    within_30_days: int = 0
+    later: int = 0
+    total: int = 0
+
+
+class ProjectStats(BaseModel):
+    as_of: date
+    owner: ExpirationBuckets
+    all_owners: ExpirationBuckets
@@ -0,0 +1,65 @@
+import re
+
+from sqlalchemy import Select, func, literal_column, or_, select, table, text
+
+from app import models
+from app.models import project_search_document
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# FTS5 shadow table maintained by the triggers declared in app.models.
+projects_fts = table("projects_fts")
+
+
+def search_statement(dialect_name: str, owner_id: int, query: str) -> Select:
+    """Build a ranked, owner-scoped project search for the given SQL dialect.
+
+    Postgres matches the GIN-indexed ``tsvector`` expression and, through ``pg_trgm``, fuzzy
+    and prefix matches on ``name``. SQLite falls back to the ``projects_fts`` FTS5 table
+    with every token treated as a prefix. Callers apply ``limit`` and ``offset``.
+    """
+
+    if dialect_name == "postgresql":
+        return _postgresql_statement(owner_id, query)
+    return _sqlite_statement(owner_id, query)
+
+
+def _postgresql_statement(owner_id: int, query: str) -> Select:
+    ts_query = func.websearch_to_tsquery(literal_column("'simple'"), query)
+    rank = func.ts_rank(project_search_document, ts_query) + func.similarity(
+        models.Project.name, query
+    )
+    return (
+        select(models.Project)
+        .where(
+            models.Project.owner_id == owner_id,
+            or_(
+                project_search_document.bool_op("@@")(ts_query),
+                models.Project.name.bool_op("%")(query),
+                models.Project.name.ilike(_escape_like(query) + "%", escape="\\"),
+            ),
+        )
+        .order_by(rank.desc(), models.Project.id.desc())
+    )
+
+
+def _sqlite_statement(owner_id: int, query: str) -> Select:
+    match = " ".join(f'"{token}"*' for token in _TOKEN.findall(query))
+    return (
+        select(models.Project)
+        .join(projects_fts, text("projects_fts.rowid = projects.id"))
+        .where(
+            models.Project.owner_id == owner_id,
+            text("projects_fts MATCH :match").bindparams(match=match),
+        )
+        # bm25() is negative, best matches first.
+        .order_by(text("bm25(projects_fts)"), models.Project.id.desc())
+    )
+
+
+def has_terms(query: str) -> bool:
+    return bool(_TOKEN.search(query))
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -1,13 +1,60 @@
+import asyncio
+import base64
+import hmac
+import math
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from hashlib import sha256
-from typing import Any, Dict
+from functools import lru_cache
+from hashlib import pbkdf2_hmac, sha256
+from typing import Any, Callable, Dict, TypeVar
 
 import bcrypt
 from jose import JWTError, jwt
 
+from app.cache import TTLCache
 from app.config import get_settings
 
-settings = get_settings()
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(RuntimeError):
+    """Raised when the password hashing queue is full and the request should be retried."""
+
+
+class PasswordHashExecutor:
+    """Dedicated, size-limited thread pool for password hashing with admission control.
+
+    bcrypt releases the GIL, so a few threads keep hashing off the event loop and the
+    request threadpool without letting a burst of logins take every core. At most
+    ``workers + max_pending`` jobs are admitted; beyond that callers fail fast.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingBusy("Password hashing queue is full")
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+@lru_cache
+def get_password_hash_executor() -> PasswordHashExecutor:
+    """Return the process-wide password hashing executor, created on first use."""
+
+    settings = get_settings()
+    return PasswordHashExecutor(settings.password_hash_workers, settings.password_hash_max_pending)
 
 
 def _normalize_password(password: str) -> str:
@@ -19,23 +66,184 @@ def _normalize_password(password: str) -> str:
     return sha256(encoded).hexdigest()
 
 
+def _elapsed_ms(fn: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    fn()
+    return (time.perf_counter() - started) * 1000
+
+
+class PasswordHasher(ABC):
+    """A password hashing scheme with a tunable work factor."""
+
+    scheme: str
+
+    @abstractmethod
+    def hash(self, password: str) -> str: ...
+
+    @abstractmethod
+    def verify(self, password: str, hashed_password: str) -> bool: ...
+
+    @abstractmethod
+    def identifies(self, hashed_password: str) -> bool:
+        """Return whether ``hashed_password`` was produced by this scheme."""
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return whether a hash of this scheme was made with different parameters."""
+
+    @abstractmethod
+    def calibrated(self, target_ms: float) -> "PasswordHasher":
+        """Return a hasher of this scheme whose cost is closest to ``target_ms`` per hash."""
+
+
+class BcryptHasher(PasswordHasher):
+    scheme = "bcrypt"
+    min_rounds = 10
+    max_rounds = 31
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        normalized = _normalize_password(password).encode("utf-8")
+        return bcrypt.hashpw(normalized, bcrypt.gensalt(self.rounds)).decode("utf-8")
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        normalized = _normalize_password(password).encode("utf-8")
+        return bcrypt.checkpw(normalized, hashed_password.encode("utf-8"))
+
+    def identifies(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(("$2a$", "$2b$", "$2y$"))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return int(hashed_password.split("$")[2]) != self.rounds
+
+    def calibrated(self, target_ms: float) -> "BcryptHasher":
+        # Each extra round doubles the cost, so time one cheap hash and extrapolate.
+        probe_rounds = 8
+        elapsed = _elapsed_ms(lambda: BcryptHasher(probe_rounds).hash("calibration"))
+        rounds = probe_rounds + round(math.log2(max(target_ms, 1e-3) / max(elapsed, 1e-3)))
+        return BcryptHasher(min(max(rounds, self.min_rounds), self.max_rounds))
+
+
+class Pbkdf2Hasher(PasswordHasher):
+    """PBKDF2-HMAC-SHA256 stored as ``$pbkdf2-sha256$<iterations>$<salt>$<digest>``."""
+
+    scheme = "pbkdf2_sha256"
+    prefix = "$pbkdf2-sha256$"
+    min_iterations = 100_000
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = secrets.token_bytes(16)
+        digest = self._derive(password, salt, self.iterations)
+        return f"{self.prefix}{self.iterations}${_b64encode(salt)}${_b64encode(digest)}"
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        iterations, salt, digest = hashed_password[len(self.prefix) :].split("$")
+        candidate = self._derive(password, _b64decode(salt), int(iterations))
+        return hmac.compare_digest(candidate, _b64decode(digest))
+
+    def identifies(self, hashed_password: str) -> bool:
+        return hashed_password.startswith(self.prefix)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return int(hashed_password[len(self.prefix) :].split("$")[0]) != self.iterations
+
+    def calibrated(self, target_ms: float) -> "Pbkdf2Hasher":
+        # Cost is linear in the iteration count.
+        probe_iterations = 10_000
+        elapsed = _elapsed_ms(lambda: self._derive("calibration", b"salt", probe_iterations))
+        iterations = int(probe_iterations * target_ms / max(elapsed, 1e-3))
+        return Pbkdf2Hasher(max(iterations, self.min_iterations))
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, iterations: int) -> bytes:
+        return pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _b64decode(encoded: str) -> bytes:
+    return base64.b64decode(encoded + "=" * (-len(encoded) % 4))
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    """Return the hasher for the configured policy, calibrated on first use if requested."""
+
+    settings = get_settings()
+    hasher: PasswordHasher
+    if settings.password_hash_scheme == "pbkdf2_sha256":
+        hasher = Pbkdf2Hasher(settings.pbkdf2_iterations)
+    else:
+        hasher = BcryptHasher(settings.bcrypt_rounds)
+    if settings.password_hash_target_ms is not None:
+        hasher = hasher.calibrated(settings.password_hash_target_ms)
+    return hasher
+
+
+def _hasher_for(hashed_password: str) -> PasswordHasher:
+    policy = get_password_hasher()
+    if policy.identifies(hashed_password):
+        return policy
+    # Hashes from a previous policy stay verifiable until they are rehashed on login.
+    for legacy in (BcryptHasher(), Pbkdf2Hasher()):
+        if legacy.identifies(hashed_password):
+            return legacy
+    raise ValueError("Unrecognized password hash format")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return whether a stored hash differs from the current hashing policy."""
+
+    policy = get_password_hasher()
+    return not policy.identifies(hashed_password) or policy.needs_rehash(hashed_password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return _hasher_for(hashed_password).verify(plain_password, hashed_password)
+
+
+def _hash_password(password: str) -> str:
+    return get_password_hasher().hash(password)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Check whether provided password matches stored hash."""
 
-    normalized = _normalize_password(plain_password).encode("utf-8")
-    return bcrypt.checkpw(normalized, hashed_password.encode("utf-8"))
+    executor = get_password_hash_executor()
+    return executor.submit(_verify_password, plain_password, hashed_password).result()
 
 
 def get_password_hash(password: str) -> str:
     """Hash password for storage."""
 
-    normalized = _normalize_password(password).encode("utf-8")
-    return bcrypt.hashpw(normalized, bcrypt.gensalt()).decode("utf-8")
+    return get_password_hash_executor().submit(_hash_password, password).result()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Awaitable :func:`verify_password` that never blocks the event loop."""
+
+    executor = get_password_hash_executor()
+    future = executor.submit(_verify_password, plain_password, hashed_password)
+    return await asyncio.wrap_future(future)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Awaitable :func:`get_password_hash` that never blocks the event loop."""
+
+    return await asyncio.wrap_future(get_password_hash_executor().submit(_hash_password, password))
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     """Generate signed JWT for the given subject."""
 
+    settings = get_settings()
     if expires_delta is None:
         expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
 
@@ -44,10 +252,32 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
+@lru_cache
+def get_token_cache() -> TTLCache:
+    """Return the process-wide cache of verified token payloads keyed by token digest."""
+
+    return TTLCache(get_settings().jwt_cache_max_size)
+
+
 def decode_access_token(token: str) -> Dict[str, Any]:
     """Validate token and return payload."""
 
+    cache = get_token_cache()
+    key = sha256(token.encode("utf-8")).digest()
+    payload = cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
+    settings = get_settings()
     try:
-        return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
     except JWTError as exc:  # pragma: no cover - defensive programming
         raise ValueError("Invalid authentication token") from exc
+
+    # Entries live exactly as long as the token is valid, so expiry is still enforced.
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        remaining = exp - time.time()
+        if remaining > 0:
+            cache.set(key, dict(payload), ttl_seconds=remaining)
+    return payload
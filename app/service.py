@@ -1,11 +1,36 @@
-from typing import Iterable, Optional
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Iterable, Iterator, NoReturn, Optional, Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import delete, false, func, insert, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import models, schemas
-from app.security import get_password_hash, verify_password
+from app import models, schemas, statements
+from app.cache import get_project_cache, invalidate_user, mark_recent_write
+from app.config import get_settings
+from app.pagination import (
+    decode_cursor,
+    decode_expiration_cursor,
+    encode_cursor,
+    encode_expiration_cursor,
+)
+from app.search import has_terms, search_statement
+from app.stats import expiration_buckets, record_changes
+from app.security import (
+    get_password_hash,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password,
+    verify_password_async,
+)
+
+
+def _record_write(owner_id: int) -> None:
+    # Called after commit: drop the owner's cached reads and keep their reads on the
+    # primary until replicas have had time to catch up.
+    get_project_cache().invalidate_owner(owner_id)
+    mark_recent_write(owner_id)
 
 
 class UserService:
@@ -15,28 +40,61 @@ class UserService:
         self.db = db
 
     def get_by_email(self, email: str) -> Optional[models.User]:
-        return self.db.scalar(select(models.User).where(models.User.email == email))
+        return self.db.scalar(*statements.user_by_email(email))
 
     def create_user(self, user_in: schemas.UserCreate) -> models.User:
-        if self.get_by_email(user_in.email):
+        self.ensure_email_available(user_in.email)
+        return self.insert_user(user_in, get_password_hash(user_in.password))
+
+    def ensure_email_available(self, email: str) -> None:
+        if self.get_by_email(email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        user = models.User(
-            email=user_in.email,
-            full_name=user_in.full_name,
-            hashed_password=get_password_hash(user_in.password),
+    def insert_user(self, user_in: schemas.UserCreate, hashed_password: str) -> models.User:
+        stmt = (
+            insert(models.User)
+            .values(
+                email=user_in.email,
+                full_name=user_in.full_name,
+                hashed_password=hashed_password,
+            )
+            .returning(models.User)
         )
-        self.db.add(user)
+        user = self.db.scalar(stmt)
         self.db.commit()
-        self.db.refresh(user)
+        invalidate_user(user.email)
+        return user
+
+    def deactivate_user(self, email: str) -> models.User:
+        user = self.get_by_email(email)
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        user.is_active = False
+        self.db.commit()
+        invalidate_user(user.email)
         return user
 
     def authenticate_user(self, email: str, password: str) -> models.User:
         user = self.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        password_valid = user is not None and verify_password(password, user.hashed_password)
+        user = self._ensure_can_login(user, password_valid)
+        if password_needs_rehash(user.hashed_password):
+            self.store_password_hash(user, get_password_hash(password))
+        return user
+
+    def store_password_hash(self, user: models.User, hashed_password: str) -> None:
+        """Persist a new hash, e.g. after the hashing policy changed."""
+
+        user.hashed_password = hashed_password
+        self.db.commit()
+        invalidate_user(user.email)
+
+    @staticmethod
+    def _ensure_can_login(user: Optional[models.User], password_valid: bool) -> models.User:
+        if not user or not password_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
@@ -56,47 +114,677 @@ class ProjectService:
         self.db = db
 
     def create_project(self, owner_id: int, project_in: schemas.ProjectCreate) -> models.Project:
-        project = models.Project(
-            name=project_in.name,
-            description=project_in.description,
-            expiration_date=project_in.expiration_date,
-            owner_id=owner_id,
+        # INSERT ... RETURNING hands back server defaults without a refresh SELECT.
+        stmt = (
+            insert(models.Project)
+            .values(
+                name=project_in.name,
+                description=project_in.description,
+                expiration_date=project_in.expiration_date,
+                owner_id=owner_id,
+            )
+            .returning(models.Project)
         )
-        self.db.add(project)
+        project = self.db.scalar(stmt)
+        record_changes(self.db, [(owner_id, project.expiration_date, 1)])
         self.db.commit()
-        self.db.refresh(project)
+        _record_write(owner_id)
         return project
 
+    def bulk_create_projects(
+        self,
+        owner_id: int,
+        projects_in: Sequence[schemas.ProjectCreate],
+    ) -> list[schemas.ProjectBulkResult]:
+        """Insert a batch of projects with a single multi-row ``INSERT ... RETURNING``."""
+
+        self._check_batch_size(len(projects_in))
+        if not projects_in:
+            return []
+
+        rows = [{**project_in.model_dump(), "owner_id": owner_id} for project_in in projects_in]
+        stmt = insert(models.Project).returning(models.Project, sort_by_parameter_order=True)
+        projects = list(self.db.scalars(stmt, rows))
+        record_changes(self.db, [(owner_id, project.expiration_date, 1) for project in projects])
+        self.db.commit()
+        _record_write(owner_id)
+        return [
+            schemas.ProjectBulkResult(id=project.id, status="created", project=project)
+            for project in projects
+        ]
+
+    def bulk_update_projects(
+        self,
+        owner_id: int,
+        updates: Sequence[schemas.ProjectBulkUpdate],
+    ) -> list[schemas.ProjectBulkResult]:
+        """Apply a batch of partial updates to the owner's projects in one transaction."""
+
+        self._check_batch_size(len(updates))
+        if not updates:
+            return []
+
+        requested_ids = {item.id for item in updates}
+        owned = select(models.Project.id, models.Project.expiration_date).where(
+            models.Project.id.in_(requested_ids),
+            models.Project.owner_id == owner_id,
+        )
+        if any("expiration_date" in item.model_fields_set for item in updates):
+            # Hold the rows so the old dates stay accurate for the stats deltas.
+            owned = owned.with_for_update()
+        old_dates = {row.id: row.expiration_date for row in self.db.execute(owned)}
+        owned_ids = set(old_dates)
+        params = [
+            item.model_dump(exclude_unset=True)
+            for item in updates
+            if item.id in owned_ids and item.model_fields_set - {"id"}
+        ]
+        if params:
+            # ORM bulk UPDATE by primary key; rows are grouped into executemany batches.
+            # The owner filter lets Postgres prune to the owner's partition. The rows are
+            # re-read below with populate_existing, so session sync is skipped.
+            self.db.execute(
+                update(models.Project).where(models.Project.owner_id == owner_id),
+                params,
+                execution_options={"synchronize_session": None},
+            )
+
+        stmt = (
+            select(models.Project)
+            .where(models.Project.id.in_(owned_ids))
+            .execution_options(populate_existing=True)
+        )
+        projects = {project.id: project for project in self.db.scalars(stmt)}
+        record_changes(
+            self.db,
+            (
+                change
+                for project in projects.values()
+                if project.expiration_date != old_dates[project.id]
+                for change in (
+                    (owner_id, old_dates[project.id], -1),
+                    (owner_id, project.expiration_date, 1),
+                )
+            ),
+        )
+        self.db.commit()
+        _record_write(owner_id)
+        return [
+            schemas.ProjectBulkResult(id=item.id, status="updated", project=projects[item.id])
+            if item.id in projects
+            else schemas.ProjectBulkResult(id=item.id, status="not_found")
+            for item in updates
+        ]
+
+    def bulk_delete_projects(
+        self,
+        owner_id: int,
+        project_ids: Sequence[int],
+    ) -> list[schemas.ProjectBulkResult]:
+        """Delete a batch of the owner's projects with a single ``DELETE ... RETURNING``."""
+
+        self._check_batch_size(len(project_ids))
+        if not project_ids:
+            return []
+
+        stmt = (
+            delete(models.Project)
+            .where(
+                models.Project.id.in_(set(project_ids)),
+                models.Project.owner_id == owner_id,
+            )
+            .returning(models.Project.id, models.Project.expiration_date)
+        )
+        deleted = self.db.execute(stmt).all()
+        deleted_ids = {row.id for row in deleted}
+        record_changes(self.db, [(owner_id, row.expiration_date, -1) for row in deleted])
+        self.db.commit()
+        _record_write(owner_id)
+        return [
+            schemas.ProjectBulkResult(
+                id=project_id,
+                status="deleted" if project_id in deleted_ids else "not_found",
+            )
+            for project_id in project_ids
+        ]
+
+    def _check_batch_size(self, size: int) -> None:
+        max_items = get_settings().projects_bulk_max_items
+        if size > max_items:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Batch exceeds the limit of {max_items} items",
+            )
+
     def list_projects(self, owner_id: Optional[int] = None) -> Iterable[models.Project]:
-        stmt = select(models.Project)
-        if owner_id is not None:
-            stmt = stmt.where(models.Project.owner_id == owner_id)
-        stmt = stmt.order_by(models.Project.created_at.desc())
-        return self.db.scalars(stmt).all()
+        return self.db.scalars(*statements.projects_newest_first(owner_id)).all()
+
+    def list_projects_page(
+        self,
+        owner_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ProjectRead], Optional[str]]:
+        """Return one cached keyset page of an owner's projects and the next-page cursor."""
+
+        settings = get_settings()
+        limit = min(limit or settings.projects_page_size, settings.projects_max_page_size)
+
+        def load() -> tuple[list[schemas.ProjectRead], Optional[str]]:
+            projects, next_cursor = self.fetch_projects_page(owner_id, limit, after)
+            items = [schemas.ProjectRead.model_validate(project) for project in projects]
+            return items, next_cursor
+
+        return get_project_cache().get_or_load(owner_id, ("page", limit, after), load)
+
+    def fetch_projects_page(
+        self,
+        owner_id: int,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> tuple[list[models.Project], Optional[str]]:
+        """Load one keyset page of an owner's projects from the database, bypassing the cache."""
+
+        keyset = None
+        if after is not None:
+            try:
+                keyset = decode_cursor(after)
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor",
+                ) from exc
+
+        # Fetch one extra row to learn whether another page exists.
+        stmt, params = statements.projects_page(owner_id, limit + 1, keyset)
+        projects = list(self.db.scalars(stmt, params))
+        if len(projects) <= limit:
+            return projects, None
+        projects = projects[:limit]
+        last = projects[-1]
+        return projects, encode_cursor(last.created_at, last.id)
+
+    def iter_projects(self, owner_id: int, batch_size: int = 500) -> Iterator[models.Project]:
+        """Stream an owner's projects through a server-side cursor, ``batch_size`` rows a fetch."""
+
+        stmt = (
+            select(models.Project)
+            .where(models.Project.owner_id == owner_id)
+            .order_by(models.Project.created_at.desc(), models.Project.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.db.scalars(stmt)
+
+    def list_expiring_projects(
+        self,
+        owner_id: int,
+        within_days: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ProjectRead], Optional[str]]:
+        """Return one cached page of projects expiring within ``within_days``, soonest first."""
+
+        settings = get_settings()
+        limit = min(limit or settings.projects_page_size, settings.projects_max_page_size)
+        today = date.today()
+        stmt = select(models.Project).where(
+            models.Project.owner_id == owner_id,
+            models.Project.expiration_date >= today,
+            models.Project.expiration_date <= today + timedelta(days=within_days),
+        )
+        if after is not None:
+            try:
+                expiration_date, project_id = decode_expiration_cursor(after)
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor",
+                ) from exc
+            stmt = stmt.where(
+                tuple_(models.Project.expiration_date, models.Project.id)
+                > (expiration_date, project_id)
+            )
+        stmt = stmt.order_by(models.Project.expiration_date, models.Project.id)
+
+        def load() -> tuple[list[schemas.ProjectRead], Optional[str]]:
+            projects = list(self.db.scalars(stmt.limit(limit + 1)))
+            next_cursor = None
+            if len(projects) > limit:
+                projects = projects[:limit]
+                last = projects[-1]
+                next_cursor = encode_expiration_cursor(last.expiration_date, last.id)
+            items = [schemas.ProjectRead.model_validate(project) for project in projects]
+            return items, next_cursor
+
+        # The window moves with the calendar, so the date is part of the key.
+        key = ("expiring", today, within_days, limit, after)
+        return get_project_cache().get_or_load(owner_id, key, load)
+
+    def list_archived_projects(
+        self,
+        owner_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ArchivedProjectRead], Optional[str]]:
+        """Return one page of the owner's archived projects, most recently expired first."""
+
+        settings = get_settings()
+        limit = min(limit or settings.projects_page_size, settings.projects_max_page_size)
+        archived = models.ArchivedProject
+        stmt = select(archived).where(archived.owner_id == owner_id)
+        if after is not None:
+            try:
+                position = decode_expiration_cursor(after)
+            except ValueError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Invalid pagination cursor",
+                ) from exc
+            stmt = stmt.where(tuple_(archived.expiration_date, archived.id) < position)
+        stmt = stmt.order_by(archived.expiration_date.desc(), archived.id.desc())
+
+        projects = list(self.db.scalars(stmt.limit(limit + 1)))
+        next_cursor = None
+        if len(projects) > limit:
+            projects = projects[:limit]
+            next_cursor = encode_expiration_cursor(projects[-1].expiration_date, projects[-1].id)
+        return [schemas.ArchivedProjectRead.model_validate(item) for item in projects], next_cursor
+
+    def search_projects(
+        self,
+        owner_id: int,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> tuple[list[schemas.ProjectRead], Optional[int]]:
+        """Return one cached page of ranked search results and the next page's offset."""
+
+        settings = get_settings()
+        limit = min(limit or settings.projects_page_size, settings.projects_max_page_size)
+
+        def load() -> tuple[list[schemas.ProjectRead], Optional[int]]:
+            if not has_terms(query):
+                return [], None
+            dialect_name = self.db.get_bind().dialect.name
+            stmt = search_statement(dialect_name, owner_id, query)
+            projects = list(self.db.scalars(stmt.limit(limit + 1).offset(offset)))
+            next_offset = offset + limit if len(projects) > limit else None
+            items = [schemas.ProjectRead.model_validate(project) for project in projects[:limit]]
+            return items, next_offset
+
+        return get_project_cache().get_or_load(owner_id, ("search", query, limit, offset), load)
 
     def get_project(self, project_id: int, owner_id: Optional[int] = None) -> models.Project:
-        stmt = select(models.Project).where(models.Project.id == project_id)
-        if owner_id is not None:
-            stmt = stmt.where(models.Project.owner_id == owner_id)
-        project = self.db.scalar(stmt)
+        project = self.db.scalar(*statements.project_by_id(project_id, owner_id))
         if project is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
         return project
 
+    def read_project(self, project_id: int, owner_id: int) -> schemas.ProjectRead:
+        """Return a cached read model of one of the owner's projects."""
+
+        return get_project_cache().get_or_load(
+            owner_id,
+            ("project", project_id),
+            lambda: schemas.ProjectRead.model_validate(self.get_project(project_id, owner_id)),
+        )
+
+    def get_project_version(self, project_id: int, owner_id: int) -> datetime:
+        """Return the project's ``updated_at`` without loading the row."""
+
+        def load() -> datetime:
+            stmt = select(models.Project.updated_at).where(
+                models.Project.id == project_id,
+                models.Project.owner_id == owner_id,
+            )
+            updated_at = self.db.scalar(stmt)
+            if updated_at is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Project not found",
+                )
+            return updated_at
+
+        return get_project_cache().get_or_load(owner_id, ("version", project_id), load)
+
+    def list_projects_version(self, owner_id: int) -> tuple[int, Optional[datetime]]:
+        """Return the owner's project count and latest ``updated_at`` for list validators."""
+
+        def load() -> tuple[int, Optional[datetime]]:
+            stmt = select(func.count(), func.max(models.Project.updated_at)).where(
+                models.Project.owner_id == owner_id
+            )
+            count, last_modified = self.db.execute(stmt).one()
+            return count, last_modified
+
+        return get_project_cache().get_or_load(owner_id, ("list_version",), load)
+
+    def project_stats(self, owner_id: int) -> schemas.ProjectStats:
+        """Bucketed expiration counts for the owner and all owners, from the summary table."""
+
+        return expiration_buckets(self.db, owner_id)
+
     def update_project(
         self,
         project_id: int,
         owner_id: int,
         project_update: schemas.ProjectUpdate,
+        if_match: Optional[Sequence[datetime]] = None,
     ) -> models.Project:
-        project = self.get_project(project_id, owner_id)
-        for field, value in project_update.model_dump(exclude_unset=True).items():
-            setattr(project, field, value)
+        """Update the owner's project; with ``if_match``, only while it has one of those versions."""
+
+        conditions = self._project_conditions(project_id, owner_id, if_match)
+        values = project_update.model_dump(exclude_unset=True)
+        if not values:
+            project = self.db.scalar(select(models.Project).where(*conditions))
+            if project is None:
+                self._raise_missing_or_modified(project_id, owner_id, if_match)
+            return project
+        # One owner-scoped UPDATE ... RETURNING replaces SELECT + UPDATE + refresh SELECT;
+        # no returned row means the project is missing, belongs to someone else, or no
+        # longer has the version the client's If-Match names.
+        stmt = (
+            update(models.Project)
+            .where(*conditions)
+            .values(**values)
+            .execution_options(populate_existing=True)
+        )
+        old_date = None
+        if "expiration_date" not in values:
+            project = self.db.scalar(stmt.returning(models.Project))
+        elif self.db.get_bind().dialect.name == "postgresql":
+            # The stats move from the date the row really had. The subquery's FOR UPDATE
+            # waits for and reads the same row version the UPDATE then changes.
+            old = (
+                select(models.Project.id, models.Project.expiration_date)
+                .where(models.Project.id == project_id, models.Project.owner_id == owner_id)
+                .with_for_update()
+                .subquery("old")
+            )
+            row = self.db.execute(
+                stmt.where(models.Project.id == old.c.id).returning(
+                    models.Project, old.c.expiration_date
+                )
+            ).one_or_none()
+            project, old_date = row if row is not None else (None, None)
+        else:
+            # SQLite cannot return FROM-clause columns. It runs one writer at a time and
+            # fails a write whose transaction read a stale snapshot, so read first.
+            old_date = self.db.scalar(
+                select(models.Project.expiration_date).where(
+                    models.Project.id == project_id, models.Project.owner_id == owner_id
+                )
+            )
+            project = self.db.scalar(stmt.returning(models.Project))
+        if project is None:
+            self._raise_missing_or_modified(project_id, owner_id, if_match)
+        if old_date is not None and old_date != project.expiration_date:
+            record_changes(
+                self.db,
+                [(owner_id, old_date, -1), (owner_id, project.expiration_date, 1)],
+            )
         self.db.commit()
-        self.db.refresh(project)
+        _record_write(owner_id)
         return project
 
-    def delete_project(self, project_id: int, owner_id: int) -> None:
-        project = self.get_project(project_id, owner_id)
-        self.db.delete(project)
+    def delete_project(
+        self,
+        project_id: int,
+        owner_id: int,
+        if_match: Optional[Sequence[datetime]] = None,
+    ) -> None:
+        """Delete the owner's project; with ``if_match``, only while it has one of those versions."""
+
+        stmt = (
+            delete(models.Project)
+            .where(*self._project_conditions(project_id, owner_id, if_match))
+            .returning(models.Project.expiration_date)
+        )
+        expiration_date = self.db.scalar(stmt)
+        if expiration_date is None:
+            self._raise_missing_or_modified(project_id, owner_id, if_match)
+        record_changes(self.db, [(owner_id, expiration_date, -1)])
         self.db.commit()
+        _record_write(owner_id)
+
+    def _project_conditions(
+        self,
+        project_id: int,
+        owner_id: int,
+        if_match: Optional[Sequence[datetime]],
+    ) -> list:
+        conditions = [models.Project.id == project_id, models.Project.owner_id == owner_id]
+        if if_match is None:
+            return conditions
+        # The version check is part of the write itself, so two writers holding the same
+        # ETag cannot both succeed, and a stale cached version can never let one through.
+        if not if_match:
+            return [*conditions, false()]
+        updated_at = models.Project.updated_at
+        if self.db.get_bind().dialect.name == "sqlite":
+            # SQLite keeps timestamps as text, and CURRENT_TIMESTAMP has no fraction
+            # while bound datetimes always carry one; compare the instants instead.
+            versions = [func.julianday(updated_at) == func.julianday(v) for v in if_match]
+        else:
+            versions = [updated_at == version for version in if_match]
+        return [*conditions, or_(*versions)]
+
+    def _raise_missing_or_modified(
+        self,
+        project_id: int,
+        owner_id: int,
+        if_match: Optional[Sequence[datetime]],
+    ) -> NoReturn:
+        if if_match is not None:
+            exists = self.db.scalar(
+                select(models.Project.id).where(
+                    models.Project.id == project_id, models.Project.owner_id == owner_id
+                )
+            )
+            if exists is not None:
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail="Project has been modified",
+                )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Project not found")
+
+
+class AsyncUserService:
+    """Async counterpart of :class:`UserService` bound to an ``AsyncSession``.
+
+    Each call runs the synchronous implementation through ``AsyncSession.run_sync``,
+    which drives it in a greenlet on the event loop: database waits yield to other
+    requests instead of holding a worker thread.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> Optional[models.User]:
+        return await self.db.run_sync(lambda session: UserService(session).get_by_email(email))
+
+    async def create_user(self, user_in: schemas.UserCreate) -> models.User:
+        # Reject duplicates before spending a bcrypt slot, then hash on the dedicated
+        # executor; run_sync would otherwise block the loop on it.
+        await self.db.run_sync(
+            lambda session: UserService(session).ensure_email_available(user_in.email)
+        )
+        hashed_password = await get_password_hash_async(user_in.password)
+        return await self.db.run_sync(
+            lambda session: UserService(session).insert_user(user_in, hashed_password)
+        )
+
+    async def authenticate_user(self, email: str, password: str) -> models.User:
+        user = await self.get_by_email(email)
+        password_valid = user is not None and await verify_password_async(
+            password, user.hashed_password
+        )
+        user = UserService._ensure_can_login(user, password_valid)
+        if password_needs_rehash(user.hashed_password):
+            hashed_password = await get_password_hash_async(password)
+            await self.db.run_sync(
+                lambda session: UserService(session).store_password_hash(user, hashed_password)
+            )
+        return user
+
+    async def deactivate_user(self, email: str) -> models.User:
+        return await self.db.run_sync(lambda session: UserService(session).deactivate_user(email))
+
+
+class AsyncProjectService:
+    """Async counterpart of :class:`ProjectService` bound to an ``AsyncSession``."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_project(
+        self,
+        owner_id: int,
+        project_in: schemas.ProjectCreate,
+    ) -> models.Project:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).create_project(owner_id, project_in)
+        )
+
+    async def bulk_create_projects(
+        self,
+        owner_id: int,
+        projects_in: Sequence[schemas.ProjectCreate],
+    ) -> list[schemas.ProjectBulkResult]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).bulk_create_projects(owner_id, projects_in)
+        )
+
+    async def bulk_update_projects(
+        self,
+        owner_id: int,
+        updates: Sequence[schemas.ProjectBulkUpdate],
+    ) -> list[schemas.ProjectBulkResult]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).bulk_update_projects(owner_id, updates)
+        )
+
+    async def bulk_delete_projects(
+        self,
+        owner_id: int,
+        project_ids: Sequence[int],
+    ) -> list[schemas.ProjectBulkResult]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).bulk_delete_projects(owner_id, project_ids)
+        )
+
+    async def list_projects_page(
+        self,
+        owner_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ProjectRead], Optional[str]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).list_projects_page(owner_id, limit, after)
+        )
+
+    async def fetch_projects_page(
+        self,
+        owner_id: int,
+        limit: int,
+        after: Optional[str] = None,
+    ) -> tuple[list[models.Project], Optional[str]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).fetch_projects_page(owner_id, limit, after)
+        )
+
+    async def iter_project_batches(
+        self,
+        owner_id: int,
+        batch_size: int = 500,
+    ) -> AsyncIterator[list[models.Project]]:
+        """Walk an owner's projects in keyset pages so no cursor stays open between batches."""
+
+        after: Optional[str] = None
+        while True:
+            projects, after = await self.fetch_projects_page(owner_id, batch_size, after)
+            yield projects
+            if after is None:
+                return
+
+    async def list_expiring_projects(
+        self,
+        owner_id: int,
+        within_days: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ProjectRead], Optional[str]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).list_expiring_projects(
+                owner_id, within_days, limit, after
+            )
+        )
+
+    async def list_archived_projects(
+        self,
+        owner_id: int,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> tuple[list[schemas.ArchivedProjectRead], Optional[str]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).list_archived_projects(owner_id, limit, after)
+        )
+
+    async def search_projects(
+        self,
+        owner_id: int,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> tuple[list[schemas.ProjectRead], Optional[int]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).search_projects(owner_id, query, limit, offset)
+        )
+
+    async def get_project(self, project_id: int, owner_id: Optional[int] = None) -> models.Project:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).get_project(project_id, owner_id)
+        )
+
+    async def read_project(self, project_id: int, owner_id: int) -> schemas.ProjectRead:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).read_project(project_id, owner_id)
+        )
+
+    async def get_project_version(self, project_id: int, owner_id: int) -> datetime:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).get_project_version(project_id, owner_id)
+        )
+
+    async def list_projects_version(self, owner_id: int) -> tuple[int, Optional[datetime]]:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).list_projects_version(owner_id)
+        )
+
+    async def project_stats(self, owner_id: int) -> schemas.ProjectStats:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).project_stats(owner_id)
+        )
+
+    async def update_project(
+        self,
+        project_id: int,
+        owner_id: int,
+        project_update: schemas.ProjectUpdate,
+        if_match: Optional[Sequence[datetime]] = None,
+    ) -> models.Project:
+        return await self.db.run_sync(
+            lambda session: ProjectService(session).update_project(
+                project_id, owner_id, project_update, if_match
+            )
+        )
+
+    async def delete_project(
+        self,
+        project_id: int,
+        owner_id: int,
+        if_match: Optional[Sequence[datetime]] = None,
+    ) -> None:
+        await self.db.run_sync(
+            lambda session: ProjectService(session).delete_project(project_id, owner_id, if_match)
+        )
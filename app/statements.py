@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Executable, bindparam, select, tuple_
+
+from app import models
+from app.config import get_settings
+
+# Hot-path queries are built once at import with named bind parameters. Executing the
+# same statement object lets SQLAlchemy reuse its memoized cache key and compiled SQL,
+# and the identical SQL text lets psycopg switch to a server-side prepared statement.
+_USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam("email"))
+
+_PROJECT_BY_ID = select(models.Project).where(models.Project.id == bindparam("project_id"))
+_OWNED_PROJECT_BY_ID = _PROJECT_BY_ID.where(models.Project.owner_id == bindparam("owner_id"))
+
+_NEWEST_FIRST = (models.Project.created_at.desc(), models.Project.id.desc())
+_ALL_PROJECTS = select(models.Project).order_by(*_NEWEST_FIRST)
+_OWNED_PROJECTS = (
+    select(models.Project)
+    .where(models.Project.owner_id == bindparam("owner_id"))
+    .order_by(*_NEWEST_FIRST)
+)
+
+_PROJECTS_PAGE = _OWNED_PROJECTS.limit(bindparam("fetch"))
+_PROJECTS_PAGE_AFTER = _PROJECTS_PAGE.where(
+    tuple_(models.Project.created_at, models.Project.id)
+    < tuple_(
+        bindparam("created_at", type_=models.Project.created_at.type),
+        bindparam("project_id", type_=models.Project.id.type),
+    )
+)
+
+Statement = tuple[Executable, dict[str, Any]]
+
+
+def _bound(stmt: Executable, **params: Any) -> Statement:
+    # With DB_CACHED_STATEMENTS off, bake the values into a fresh copy per call, which
+    # costs what building a new select() did; useful to measure the difference.
+    if get_settings().db_cached_statements:
+        return stmt, params
+    return stmt.params(**params), {}
+
+
+def user_by_email(email: str) -> Statement:
+    return _bound(_USER_BY_EMAIL, email=email)
+
+
+def project_by_id(project_id: int, owner_id: Optional[int] = None) -> Statement:
+    if owner_id is None:
+        return _bound(_PROJECT_BY_ID, project_id=project_id)
+    return _bound(_OWNED_PROJECT_BY_ID, project_id=project_id, owner_id=owner_id)
+
+
+def projects_newest_first(owner_id: Optional[int] = None) -> Statement:
+    if owner_id is None:
+        return _bound(_ALL_PROJECTS)
+    return _bound(_OWNED_PROJECTS, owner_id=owner_id)
+
+
+def projects_page(
+    owner_id: int,
+    fetch: int,
+    after: Optional[tuple[datetime, int]] = None,
+) -> Statement:
+    """Up to ``fetch`` of an owner's projects, newest first, strictly after the keyset ``after``."""
+
+    if after is None:
+        return _bound(_PROJECTS_PAGE, owner_id=owner_id, fetch=fetch)
+    created_at, project_id = after
+    return _bound(
+        _PROJECTS_PAGE_AFTER,
+        owner_id=owner_id,
+        fetch=fetch,
+        created_at=created_at,
+        project_id=project_id,
+    )
@@ -0,0 +1,206 @@
+"""Per-owner and all-owner project counts by expiration date.
+
+Run ``python -m app.stats`` to check the summary table against ``projects``, or add
+``--repair`` to rewrite the rows that drifted.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import case, delete, func, or_, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.config import get_settings
+from app.database import get_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Scope label of the all-owner totals in query results; no summary row uses it.
+ALL_OWNERS = 0
+
+counts = models.ProjectExpirationCount.__table__
+
+
+def all_owners_shard(owner_id: int) -> int:
+    """``owner_id`` of the summary rows holding ``owner_id``'s share of the all-owner totals.
+
+    The totals are split over ``STATS_GLOBAL_SHARDS`` rows per date, stored under the
+    negative owner ids ``-1 .. -N``. A write only locks its own shard, so writers for
+    different owners rarely wait for each other; reads sum the shards.
+    """
+
+    return -1 - owner_id % get_settings().stats_global_shards
+
+
+def record_changes(db: Session, changes: Iterable[tuple[int, date, int]]) -> None:
+    """Apply ``(owner_id, expiration_date, delta)`` changes inside the caller's transaction.
+
+    Each change also moves the owner's all-owner shard for that date. Deltas are merged
+    first and upserted in key order, so concurrent writers lock summary rows in the same
+    order.
+    """
+
+    deltas: Counter[tuple[int, date]] = Counter()
+    for owner_id, expiration_date, delta in changes:
+        deltas[(owner_id, expiration_date)] += delta
+        deltas[(all_owners_shard(owner_id), expiration_date)] += delta
+    rows = [
+        {"owner_id": owner_id, "expiration_date": expiration_date, "project_count": delta}
+        for (owner_id, expiration_date), delta in sorted(deltas.items())
+        if delta
+    ]
+    if rows:
+        db.execute(_upsert(db, increment=True), rows)
+
+
+def expiration_buckets(
+    db: Session,
+    owner_id: int,
+    today: Optional[date] = None,
+) -> schemas.ProjectStats:
+    """Read the owner's and all owners' bucketed counts from the summary table.
+
+    The query touches one summary row per distinct expiration date of the owner and of
+    each all-owner shard, so its cost does not grow with the number of projects.
+    """
+
+    today = today or date.today()
+    week, month = today + timedelta(days=7), today + timedelta(days=30)
+
+    def bucket(condition):
+        return func.sum(case((condition, counts.c.project_count), else_=0))
+
+    scope = case((counts.c.owner_id < 0, ALL_OWNERS), else_=counts.c.owner_id).label("scope")
+    stmt = (
+        select(
+            scope,
+            bucket(counts.c.expiration_date < today).label("expired"),
+            bucket(counts.c.expiration_date.between(today, week)).label("within_7_days"),
+            bucket((counts.c.expiration_date > week) & (counts.c.expiration_date <= month)).label(
+                "within_30_days"
+            ),
+            bucket(counts.c.expiration_date > month).label("later"),
+            func.sum(counts.c.project_count).label("total"),
+        )
+        .where(or_(counts.c.owner_id == owner_id, counts.c.owner_id < 0))
+        .group_by(scope)
+    )
+    scopes = {
+        row.scope: schemas.ExpirationBuckets.model_validate(row, from_attributes=True)
+        for row in db.execute(stmt)
+    }
+    empty = schemas.ExpirationBuckets()
+    return schemas.ProjectStats(
+        as_of=today,
+        owner=scopes.get(owner_id, empty),
+        all_owners=scopes.get(ALL_OWNERS, empty),
+    )
+
+
+class StatsReport(NamedTuple):
+    checked: int
+    mismatched: int
+    repaired: bool
+    seconds: float
+
+
+def verify_project_stats(db: Session, repair: bool = False) -> StatsReport:
+    """Recount ``projects`` and compare every summary row with the real count.
+
+    This is the one full scan of ``projects``; run it periodically to catch drift from
+    writes that bypass the service layer (e.g. ``ON DELETE CASCADE`` from ``users``). With
+    ``repair`` the drifted rows are rewritten and empty rows dropped. On Postgres the
+    summary table is locked for the duration, so in-flight writers finish first and new
+    ones queue behind the repair. Repairing also moves the all-owner totals onto new
+    shards after ``STATS_GLOBAL_SHARDS`` changed.
+    """
+
+    started = time.perf_counter()
+    if db.get_bind().dialect.name == "postgresql":
+        if repair:
+            db.execute(text(f"LOCK TABLE {counts.name} IN EXCLUSIVE MODE"))
+        else:
+            # Both reads must see the same snapshot, or a concurrent write looks like drift.
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    actual: Counter[tuple[int, date]] = Counter()
+    rows = db.execute(
+        select(models.Project.owner_id, models.Project.expiration_date, func.count()).group_by(
+            models.Project.owner_id, models.Project.expiration_date
+        )
+    )
+    for owner_id, expiration_date, project_count in rows:
+        actual[(owner_id, expiration_date)] += project_count
+        actual[(all_owners_shard(owner_id), expiration_date)] += project_count
+    stored = {
+        (owner_id, expiration_date): project_count
+        for owner_id, expiration_date, project_count in db.execute(
+            select(counts.c.owner_id, counts.c.expiration_date, counts.c.project_count)
+        )
+    }
+
+    mismatched = sorted(
+        key for key in actual.keys() | stored.keys() if actual.get(key, 0) != stored.get(key, 0)
+    )
+    for owner_id, expiration_date in mismatched[:20]:
+        logger.warning(
+            "owner %d, %s: stored %d, actual %d",
+            owner_id,
+            expiration_date,
+            stored.get((owner_id, expiration_date), 0),
+            actual.get((owner_id, expiration_date), 0),
+        )
+    if repair and mismatched:
+        rows = [
+            {"owner_id": key[0], "expiration_date": key[1], "project_count": actual[key]}
+            for key in mismatched
+        ]
+        db.execute(_upsert(db, increment=False), rows)
+        db.execute(delete(counts).where(counts.c.project_count == 0))
+    db.commit()
+    return StatsReport(
+        len(actual.keys() | stored.keys()),
+        len(mismatched),
+        repair and bool(mismatched),
+        time.perf_counter() - started,
+    )
+
+
+def _upsert(db: Session, increment: bool):
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    stmt = insert(counts)
+    value = stmt.excluded.project_count
+    return stmt.on_conflict_do_update(
+        index_elements=[counts.c.owner_id, counts.c.expiration_date],
+        set_={"project_count": counts.c.project_count + value if increment else value},
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repair", action="store_true", help="rewrite drifted summary rows")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with get_sessionmaker()() as db:
+        report = verify_project_stats(db, repair=args.repair)
+    logger.info(
+        "done: %d summary rows checked, %d mismatched%s, %.1fs",
+        report.checked,
+        report.mismatched,
+        " and repaired" if report.repaired else "",
+        report.seconds,
+    )
+    return 1 if report.mismatched and not report.repaired else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
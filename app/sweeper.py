@@ -0,0 +1,127 @@
+"""Batched sweeper for expired projects.
+
+Run ``python -m app.sweeper`` to report expired projects, or add ``--delete`` to remove them.
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import date
+from typing import NamedTuple, Optional
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.orm import Session
+
+from app import models
+from app.cache import invalidate_owners_from_job
+from app.config import get_settings
+from app.database import get_sessionmaker
+from app.stats import record_changes
+
+logger = logging.getLogger(__name__)
+
+
+class SweepReport(NamedTuple):
+    scanned: int
+    deleted: int
+    batches: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.scanned / self.seconds if self.seconds > 0 else 0.0
+
+
+def sweep_expired_projects(
+    db: Session,
+    as_of: Optional[date] = None,
+    batch_size: Optional[int] = None,
+    remove: bool = False,
+) -> SweepReport:
+    """Walk projects that expired before ``as_of`` across all owners in keyset batches.
+
+    Each batch reads at most ``batch_size`` ids in ``(expiration_date, id)`` order and
+    commits before the next one. Locks are held for a single batch only, and memory stays
+    flat however large the table is. With ``remove`` the batch is deleted. Otherwise the
+    sweep only counts what it would delete.
+    """
+
+    as_of = as_of or date.today()
+    batch_size = batch_size or get_settings().expiration_sweep_batch_size
+    scanned = deleted = batches = 0
+    position: Optional[tuple[date, int]] = None
+    started = time.perf_counter()
+
+    while True:
+        stmt = select(models.Project.expiration_date, models.Project.id).where(
+            models.Project.expiration_date < as_of
+        )
+        if position is not None:
+            stmt = stmt.where(tuple_(models.Project.expiration_date, models.Project.id) > position)
+        rows = db.execute(
+            stmt.order_by(models.Project.expiration_date, models.Project.id).limit(batch_size)
+        ).all()
+        if not rows:
+            db.commit()
+            break
+
+        batch_deleted = 0
+        if remove:
+            # Re-check the predicate so a project extended since it was read survives.
+            removed = db.execute(
+                delete(models.Project)
+                .where(
+                    models.Project.id.in_([row.id for row in rows]),
+                    models.Project.expiration_date < as_of,
+                )
+                .returning(models.Project.owner_id, models.Project.expiration_date)
+            ).all()
+            record_changes(db, [(row.owner_id, row.expiration_date, -1) for row in removed])
+            batch_deleted = len(removed)
+        db.commit()
+        if remove:
+            invalidate_owners_from_job(row.owner_id for row in removed)
+
+        position = (rows[-1].expiration_date, rows[-1].id)
+        batches += 1
+        scanned += len(rows)
+        deleted += batch_deleted
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "batch %d: %d expired projects scanned, %d deleted (%.0f rows/s)",
+            batches,
+            scanned,
+            deleted,
+            scanned / elapsed if elapsed > 0 else 0.0,
+        )
+        if len(rows) < batch_size:
+            break
+
+    return SweepReport(scanned, deleted, batches, time.perf_counter() - started)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--delete", action="store_true", help="delete expired projects")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="YYYY-MM-DD")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    with get_sessionmaker()() as db:
+        report = sweep_expired_projects(db, args.as_of, args.batch_size, remove=args.delete)
+    logger.info(
+        "done: %d scanned, %d deleted in %d batches, %.1fs (%.0f rows/s)",
+        report.scanned,
+        report.deleted,
+        report.batches,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
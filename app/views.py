@@ -1,12 +1,28 @@
-from typing import List
+from typing import List, Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app import models, schemas
+from app import schemas
 from app.database import get_db
-from app.dependencies import get_current_user
+from app.dependencies import get_current_user, get_read_db
+from app.export import csv_chunks, export_response, ndjson_chunks
+from app.http_cache import (
+    if_match_versions,
+    list_etag,
+    not_modified,
+    project_etag,
+    validator_headers,
+)
+from app.responses import (
+    ARCHIVED_PROJECT_LIST,
+    BULK_RESULTS,
+    PROJECT_LIST,
+    json_response,
+    page_response,
+    project_response,
+)
 from app.security import create_access_token
 from app.service import ProjectService, UserService
 
@@ -41,60 +57,243 @@ def login_for_access_token(
 @project_router.post("/", response_model=schemas.ProjectRead, status_code=status.HTTP_201_CREATED)
 def create_project(
     project_in: schemas.ProjectCreate,
-    current_user: models.User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Create a project owned by the authenticated user."""
 
     project_service = ProjectService(db)
     project = project_service.create_project(current_user.id, project_in)
-    return project
+    return project_response(request, response, project, status.HTTP_201_CREATED)
+
+
+@project_router.post(
+    "/bulk",
+    response_model=List[schemas.ProjectBulkResult],
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_projects(
+    projects_in: List[schemas.ProjectCreate],
+    request: Request,
+    response: Response,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Create a batch of projects owned by the authenticated user."""
+
+    project_service = ProjectService(db)
+    results = project_service.bulk_create_projects(current_user.id, projects_in)
+    return json_response(request, response, BULK_RESULTS, results, status.HTTP_201_CREATED)
+
+
+@project_router.patch("/bulk", response_model=List[schemas.ProjectBulkResult])
+def bulk_update_projects(
+    updates: List[schemas.ProjectBulkUpdate],
+    request: Request,
+    response: Response,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Apply partial updates to a batch of projects, reporting the outcome per item."""
+
+    project_service = ProjectService(db)
+    results = project_service.bulk_update_projects(current_user.id, updates)
+    return json_response(request, response, BULK_RESULTS, results)
+
+
+@project_router.delete("/bulk", response_model=List[schemas.ProjectBulkResult])
+def bulk_delete_projects(
+    request: Request,
+    response: Response,
+    project_ids: List[int] = Body(...),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Remove a batch of projects, reporting the outcome per item."""
+
+    project_service = ProjectService(db)
+    results = project_service.bulk_delete_projects(current_user.id, project_ids)
+    return json_response(request, response, BULK_RESULTS, results)
 
 
 @project_router.get("/", response_model=List[schemas.ProjectRead])
 def list_projects(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None, description="Cursor from a previous page's X-Next-Cursor"),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ):
-    """Return all projects owned by the current user."""
+    """Return a page of projects owned by the current user, newest first."""
 
     project_service = ProjectService(db)
-    return project_service.list_projects(owner_id=current_user.id)
+    count, last_modified = project_service.list_projects_version(current_user.id)
+    # No Last-Modified: deleting a project leaves max(updated_at) where it was, so only
+    # the ETag, which also covers the count, tells a client the list changed.
+    etag = list_etag(current_user.id, count, last_modified, limit, after)
+    cached = not_modified(request, etag, None)
+    if cached is not None:
+        return cached
+
+    projects, next_cursor = project_service.list_projects_page(
+        current_user.id,
+        limit=limit,
+        after=after,
+    )
+    response.headers.update(validator_headers(etag, None))
+    return page_response(request, response, PROJECT_LIST, projects, next_cursor)
+
+
+@project_router.get("/export")
+def export_projects(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """Stream every project owned by the current user as NDJSON or CSV."""
+
+    project_service = ProjectService(db)
+    projects = project_service.iter_projects(current_user.id)
+    chunks = csv_chunks if export_format == "csv" else ndjson_chunks
+    return export_response(chunks(projects), export_format)
+
+
+@project_router.get("/expiring", response_model=List[schemas.ProjectRead])
+def list_expiring_projects(
+    request: Request,
+    response: Response,
+    within_days: int = Query(30, ge=0, le=3650),
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None, description="Cursor from a previous page's X-Next-Cursor"),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """Return the current user's projects expiring within ``within_days``, soonest first."""
+
+    project_service = ProjectService(db)
+    projects, next_cursor = project_service.list_expiring_projects(
+        current_user.id,
+        within_days,
+        limit=limit,
+        after=after,
+    )
+    return page_response(request, response, PROJECT_LIST, projects, next_cursor)
+
+
+@project_router.get("/search", response_model=List[schemas.ProjectRead])
+def search_projects(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int | None = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """Search the current user's projects by name and description, best matches first."""
+
+    project_service = ProjectService(db)
+    projects, next_offset = project_service.search_projects(
+        current_user.id,
+        q,
+        limit=limit,
+        offset=offset,
+    )
+    return page_response(
+        request, response, PROJECT_LIST, projects, next_offset, header="X-Next-Offset"
+    )
+
+
+@project_router.get("/archive", response_model=List[schemas.ArchivedProjectRead])
+def list_archived_projects(
+    request: Request,
+    response: Response,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None, description="Cursor from a previous page's X-Next-Cursor"),
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """Return the current user's archived projects, most recently expired first."""
+
+    project_service = ProjectService(db)
+    projects, next_cursor = project_service.list_archived_projects(
+        current_user.id,
+        limit=limit,
+        after=after,
+    )
+    return page_response(request, response, ARCHIVED_PROJECT_LIST, projects, next_cursor)
+
+
+@project_router.get("/stats", response_model=schemas.ProjectStats)
+def project_stats(
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """Count the current user's and all owners' projects by expiration bucket."""
+
+    project_service = ProjectService(db)
+    return project_service.project_stats(current_user.id)
 
 
 @project_router.get("/{project_id}", response_model=schemas.ProjectRead)
 def get_project(
     project_id: int,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ):
     """Retrieve a single project ensuring ownership."""
 
     project_service = ProjectService(db)
-    return project_service.get_project(project_id, owner_id=current_user.id)
+    if "if-none-match" in request.headers or "if-modified-since" in request.headers:
+        # Revalidate against updated_at alone before paying for the full row.
+        updated_at = project_service.get_project_version(project_id, current_user.id)
+        cached = not_modified(request, project_etag(project_id, updated_at), updated_at)
+        if cached is not None:
+            return cached
+
+    project = project_service.read_project(project_id, owner_id=current_user.id)
+    return project_response(request, response, project)
 
 
 @project_router.patch("/{project_id}", response_model=schemas.ProjectRead)
 def update_project(
     project_id: int,
     project_update: schemas.ProjectUpdate,
-    current_user: models.User = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Apply partial updates to a project when the current user is the owner."""
 
     project_service = ProjectService(db)
-    return project_service.update_project(project_id, owner_id=current_user.id, project_update=project_update)
+    project = project_service.update_project(
+        project_id,
+        owner_id=current_user.id,
+        project_update=project_update,
+        if_match=if_match_versions(request, project_id),
+    )
+    return project_response(request, response, project)
 
 
 @project_router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: int,
-    current_user: models.User = Depends(get_current_user),
+    request: Request,
+    current_user: schemas.AuthenticatedUser = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Remove a project owned by the current user."""
 
     project_service = ProjectService(db)
-    project_service.delete_project(project_id, owner_id=current_user.id)
+    project_service.delete_project(
+        project_id,
+        owner_id=current_user.id,
+        if_match=if_match_versions(request, project_id),
+    )
     return None
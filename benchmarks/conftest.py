@@ -0,0 +1,211 @@
+"""Fixtures for the service-layer microbenchmarks.
+
+Each benchmark is timed with :mod:`timeit` as a ratio to a fixed reference workload
+and compared with ``BENCH_BASELINE`` (the committed ``benchmarks/baseline.json``). A
+benchmark fails when it is more than ``BENCH_REGRESSION_THRESHOLD`` percent slower than
+its baseline. Set ``BENCH_UPDATE_BASELINE=1`` to record new ratios instead.
+
+Ratios carry over between machines far better than seconds, but not perfectly; CI runs
+the suite with a wider threshold than the default. The baseline notes the runner and
+library versions it was recorded with, and a failure reports them.
+"""
+
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Generator
+from datetime import date, timedelta
+from importlib.metadata import version
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import models
+from app.cache import get_project_cache, get_user_cache
+from app.config import get_settings
+from app.database import Base
+from app.security import BcryptHasher, get_token_cache
+
+BASELINE_PATH = Path(os.environ.get("BENCH_BASELINE", Path(__file__).with_name("baseline.json")))
+SIZES = [int(size) for size in os.environ.get("BENCH_SIZES", "10,1000,100000").split(",")]
+THRESHOLD_PERCENT = float(os.environ.get("BENCH_REGRESSION_THRESHOLD", "25"))
+UPDATE_BASELINE = os.environ.get("BENCH_UPDATE_BASELINE") == "1"
+PASSWORD = "BenchPass123!"
+MACHINE_KEY = "_machine"
+# bcrypt's cost is a policy setting, not code; at the minimum cost authenticate_user
+# measures the service path around the hash rather than the hash alone.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+
+class Bench:
+    """Times callables relative to a reference workload and checks them against the baseline.
+
+    The reference (:func:`_reference_workload`) exercises raw ``sqlite3`` and pydantic-core,
+    the same engines the benchmarks mostly measure, but none of the application's code.
+    It is timed alternately with each benchmark, so CPU frequency changes and noisy
+    neighbours slow both sides alike and cancel out of the ratio.
+    """
+
+    def __init__(self, baseline: dict[str, float], recorded_on: str | None = None):
+        self.baseline = baseline
+        self.recorded_on = recorded_on
+        self.results: dict[str, float] = {}
+        self._reference = timeit.Timer(_reference_workload)
+        self._reference_number = _loop_size(self._reference)
+
+    def __call__(self, name: str, fn: Callable[[], object], repeat: int = 7) -> float:
+        timer = timeit.Timer(fn)
+        number = _loop_size(timer)
+        seconds, ratio = self._measure(timer, number, repeat)
+        expected = self.baseline.get(name)
+        if not UPDATE_BASELINE and expected:
+            limit = expected * (1 + THRESHOLD_PERCENT / 100)
+            if ratio > limit:
+                # Noise comes in bursts; a real regression survives a second measurement.
+                seconds, ratio = min(
+                    (seconds, ratio),
+                    self._measure(timer, number, repeat),
+                    key=lambda measured: measured[1],
+                )
+            assert ratio <= limit, (
+                f"{name} regressed: {ratio:.3g}x the reference workload "
+                f"({seconds * 1e6:.1f}us per call), baseline {expected:.3g}x "
+                f"(+{THRESHOLD_PERCENT:g}% allowed, recorded on {self.recorded_on})"
+            )
+        self.results[name] = ratio
+        return seconds
+
+    def _measure(self, timer: timeit.Timer, number: int, repeat: int) -> tuple[float, float]:
+        """Best per-call seconds and the median ratio to the reference over ``repeat`` samples."""
+
+        samples, ratios = [], []
+        for _ in range(repeat):
+            before = self._time_reference()
+            elapsed = timer.timeit(number) / number
+            after = self._time_reference()
+            samples.append(elapsed)
+            ratios.append(elapsed / min(before, after))
+        return min(samples), statistics.median(ratios)
+
+    def _time_reference(self) -> float:
+        return self._reference.timeit(self._reference_number) / self._reference_number
+
+
+def _loop_size(timer: timeit.Timer) -> int:
+    # Many short samples give a steadier median than a few long ones.
+    number, seconds = timer.autorange()
+    return max(1, round(number * 0.05 / seconds))
+
+
+class _ReferenceRow(BaseModel):
+    id: int
+    name: str
+    expiration_date: date
+
+
+_REFERENCE_ROWS = TypeAdapter(list[_ReferenceRow])
+_reference_db = sqlite3.connect(":memory:", check_same_thread=False)
+_reference_db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT, expiration_date TEXT)")
+_reference_db.executemany(
+    "INSERT INTO t VALUES (?, ?, ?)",
+    [(index, f"row {index}", "2030-01-01") for index in range(200)],
+)
+
+
+def _reference_workload() -> None:
+    cursor = _reference_db.execute("SELECT id, name, expiration_date FROM t WHERE id >= ?", (100,))
+    rows = [dict(zip(("id", "name", "expiration_date"), row)) for row in cursor]
+    _REFERENCE_ROWS.dump_json(_REFERENCE_ROWS.validate_python(rows))
+
+
+def _machine() -> str:
+    """Describe the CPU, interpreter and libraries whose speed the benchmarks mostly measure."""
+
+    libraries = ", ".join(f"{name} {version(name)}" for name in ("sqlalchemy", "pydantic-core"))
+    return (
+        f"{platform.machine()} {platform.processor() or '-'} "
+        f"cpus={os.cpu_count()} {platform.python_implementation()} "
+        f"{'.'.join(map(str, sys.version_info[:3]))}, {libraries}"
+    )
+
+
+@pytest.fixture(scope="session")
+def bench() -> Generator[Bench, None, None]:
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+    recorded_on = baseline.pop(MACHINE_KEY, None)
+    recorder = Bench(baseline, recorded_on)
+    yield recorder
+    if UPDATE_BASELINE and recorder.results:
+        # Merge, so a partial update (e.g. with -k) keeps the entries it does not touch.
+        merged = {**baseline, **recorder.results, MACHINE_KEY: _machine()}
+        BASELINE_PATH.write_text(json.dumps(dict(sorted(merged.items())), indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def engine() -> Generator[Engine, None, None]:
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def hashed_password() -> str:
+    return BcryptHasher(get_settings().bcrypt_rounds).hash(PASSWORD)
+
+
+@pytest.fixture(scope="session")
+def owners(engine: Engine, hashed_password: str) -> dict[int, models.User]:
+    """One owner per benchmark size, each holding that many projects."""
+
+    expiration = date.today() + timedelta(days=30)
+    result = {}
+    with Session(engine, expire_on_commit=False) as session:
+        for size in SIZES:
+            user = models.User(
+                email=f"owner{size}@example.com",
+                full_name=f"Owner {size}",
+                hashed_password=hashed_password,
+            )
+            session.add(user)
+            session.flush()
+            session.execute(
+                insert(models.Project),
+                [
+                    {
+                        "name": f"Project {index}",
+                        "description": f"benchmark project {index}",
+                        "expiration_date": expiration + timedelta(days=index % 365),
+                        "owner_id": user.id,
+                    }
+                    for index in range(size)
+                ],
+            )
+            result[size] = user
+        session.commit()
+    return result
+
+
+@pytest.fixture
+def db(engine: Engine) -> Generator[Session, None, None]:
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    for cache in (get_user_cache(), get_token_cache(), get_project_cache()):
+        cache.clear()
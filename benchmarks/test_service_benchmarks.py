@@ -0,0 +1,114 @@
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.cache import get_project_cache
+from app.responses import PROJECT_LIST
+from app.security import create_access_token, decode_access_token, get_token_cache
+from app.service import ProjectService, UserService
+
+from benchmarks.conftest import PASSWORD, SIZES, Bench
+
+per_size = pytest.mark.parametrize("size", SIZES)
+
+
+@per_size
+def test_project_reads(bench: Bench, db: Session, owners, size: int) -> None:
+    owner = owners[size]
+    service = ProjectService(db)
+    project_id = db.scalar(
+        select(models.Project.id).where(models.Project.owner_id == owner.id).limit(1)
+    )
+
+    bench(f"fetch_projects_page[{size}]", lambda: service.fetch_projects_page(owner.id, 100))
+    bench(f"list_projects_page_cached[{size}]", lambda: service.list_projects_page(owner.id))
+    bench(f"get_project[{size}]", lambda: service.get_project(project_id, owner.id))
+    bench(f"read_project_cached[{size}]", lambda: service.read_project(project_id, owner.id))
+
+    def uncached_version() -> None:
+        get_project_cache().invalidate_owner(owner.id)
+        service.list_projects_version(owner.id)
+
+    bench(f"list_projects_version[{size}]", uncached_version)
+
+    def uncached_expiring() -> None:
+        get_project_cache().invalidate_owner(owner.id)
+        service.list_expiring_projects(owner.id, 30, 100)
+
+    bench(f"list_expiring_projects[{size}]", uncached_expiring)
+
+    def uncached_search() -> None:
+        get_project_cache().invalidate_owner(owner.id)
+        service.search_projects(owner.id, "project 1", 20)
+
+    bench(f"search_projects[{size}]", uncached_search)
+
+
+@per_size
+def test_project_iteration(bench: Bench, db: Session, owners, size: int) -> None:
+    owner = owners[size]
+    service = ProjectService(db)
+
+    def drain() -> None:
+        for _ in service.iter_projects(owner.id):
+            pass
+        db.expunge_all()
+
+    bench(f"iter_projects[{size}]", drain)
+
+
+@per_size
+def test_project_writes(bench: Bench, db: Session, owners, size: int) -> None:
+    owner = owners[size]
+    service = ProjectService(db)
+    project = service.fetch_projects_page(owner.id, 1)[0][0]
+    update = schemas.ProjectUpdate(description="benchmark update")
+
+    bench(f"update_project[{size}]", lambda: service.update_project(project.id, owner.id, update))
+
+
+@per_size
+def test_project_read_serialization(bench: Bench, db: Session, owners, size: int) -> None:
+    projects, _ = ProjectService(db).fetch_projects_page(owners[size].id, min(size, 1000))
+
+    def serialize() -> None:
+        for project in projects:
+            schemas.ProjectRead.model_validate(project).model_dump_json()
+
+    bench(f"project_read_serialization[{min(size, 1000)}]", serialize)
+
+
+def test_user_and_token_paths(bench: Bench, db: Session, owners) -> None:
+    owner = owners[SIZES[0]]
+    service = UserService(db)
+    token = create_access_token(owner.email)
+
+    bench("get_by_email", lambda: service.get_by_email(owner.email))
+    bench("authenticate_user", lambda: service.authenticate_user(owner.email, PASSWORD))
+    bench("create_access_token", lambda: create_access_token(owner.email))
+    bench("decode_access_token_cached", lambda: decode_access_token(token))
+
+    def uncached_decode() -> None:
+        get_token_cache().clear()
+        decode_access_token(token)
+
+    bench("decode_access_token", uncached_decode)
+
+
+@per_size
+def test_project_list_rendering(bench: Bench, db: Session, owners, size: int) -> None:
+    page = min(size, 1000)
+    projects, _ = ProjectService(db).fetch_projects_page(owners[size].id, page)
+    items = PROJECT_LIST.validate_python(projects, from_attributes=True)
+
+    def response_model() -> None:
+        # What FastAPI's response_model path does: revalidate, dump to Python, json.dumps.
+        validated = PROJECT_LIST.validate_python(items, from_attributes=True)
+        content = PROJECT_LIST.dump_python(validated, mode="json")
+        json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode()
+
+    bench(f"project_list_response_model[{page}]", response_model)
+    bench(f"project_list_fast_json[{page}]", lambda: PROJECT_LIST.dump_json(items))
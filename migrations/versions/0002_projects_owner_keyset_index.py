@@ -0,0 +1,39 @@
+"""add owner keyset index on projects
+
+Revision ID: 0002_projects_owner_keyset_index
+Revises: 0001_create_core_tables
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_projects_owner_keyset_index"
+down_revision: Union[str, None] = "0001_create_core_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build without blocking writes on large tables; CONCURRENTLY cannot run in a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_owner_id_created_at_id",
+            "projects",
+            ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_owner_id_created_at_id",
+            table_name="projects",
+            postgresql_concurrently=True,
+        )
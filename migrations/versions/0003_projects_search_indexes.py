@@ -0,0 +1,59 @@
+"""add full-text and trigram search indexes on projects
+
+Revision ID: 0003_projects_search_indexes
+Revises: 0002_projects_owner_keyset_index
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_projects_search_indexes"
+down_revision: Union[str, None] = "0002_projects_owner_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.project_search_document exactly for the planner to use the index.
+SEARCH_DOCUMENT = (
+    "to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_search_document",
+            "projects",
+            [sa.text(SEARCH_DOCUMENT)],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_projects_name_trgm",
+            "projects",
+            ["name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_name_trgm",
+            table_name="projects",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_projects_search_document",
+            table_name="projects",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,49 @@
+"""add expiration indexes on projects
+
+Revision ID: 0004_projects_expiration_indexes
+Revises: 0003_projects_search_indexes
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_projects_expiration_indexes"
+down_revision: Union[str, None] = "0003_projects_search_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_owner_id_expiration_date",
+            "projects",
+            ["owner_id", "expiration_date", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_projects_expiration_date_id",
+            "projects",
+            ["expiration_date", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_expiration_date_id",
+            table_name="projects",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_projects_owner_id_expiration_date",
+            table_name="projects",
+            postgresql_concurrently=True,
+        )
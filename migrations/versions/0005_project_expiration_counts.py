@@ -0,0 +1,53 @@
+"""add project_expiration_counts summary table
+
+Revision ID: 0005_project_expiration_counts
+Revises: 0004_projects_expiration_indexes
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import get_settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_project_expiration_counts"
+down_revision: Union[str, None] = "0004_projects_expiration_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_expiration_counts",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("expiration_date", sa.Date(), nullable=False),
+        sa.Column("project_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id", "expiration_date"),
+    )
+    # Backfill per owner, then the all-owner totals onto their shards (see
+    # ``app.stats.all_owners_shard``). Writes that land between this and the deploy of the
+    # maintaining code are fixed by ``python -m app.stats --repair``.
+    op.execute(
+        """
+        INSERT INTO project_expiration_counts (owner_id, expiration_date, project_count)
+        SELECT owner_id, expiration_date, count(*) FROM projects
+        GROUP BY owner_id, expiration_date
+        """
+    )
+    op.execute(
+        sa.text(
+            """
+            INSERT INTO project_expiration_counts (owner_id, expiration_date, project_count)
+            SELECT -1 - owner_id % :shards, expiration_date, count(*) FROM projects
+            GROUP BY 1, 2
+            """
+        ).bindparams(shards=get_settings().stats_global_shards)
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_expiration_counts")
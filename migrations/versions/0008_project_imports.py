@@ -0,0 +1,38 @@
+"""add project_imports checkpoint table
+
+Revision ID: 0008_project_imports
+Revises: 0007_projects_archive
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008_project_imports"
+down_revision: Union[str, None] = "0007_projects_archive"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_imports",
+        sa.Column("import_id", sa.String(length=255), primary_key=True),
+        sa.Column("records_done", sa.Integer(), nullable=False),
+        sa.Column("rows_loaded", sa.Integer(), nullable=False),
+        sa.Column("rows_rejected", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("project_imports")
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Load-test the API and report throughput and latency percentiles as JSON.
+
+Runs against ``--url`` or, by default, an in-process Uvicorn server backed by
+``DATABASE_URL`` (a throwaway SQLite file when unset):
+
+    uv run python -m scripts.benchmark --users 10 --projects 1000 --duration 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Iterator
+
+PASSWORD = "BenchPass123!"
+WORKLOADS = ("read", "write", "login")
+
+
+class Client:
+    """One keep-alive HTTP connection, reopened transparently after errors."""
+
+    def __init__(self, base_url: str, timeout: float = 30.0):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        self.https = parsed.scheme == "https"
+        self.timeout = timeout
+        self.connection: http.client.HTTPConnection | None = None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: Any = None,
+        token: str | None = None,
+        form: dict[str, str] | None = None,
+    ) -> tuple[int, bytes]:
+        headers = {"Connection": "keep-alive"}
+        payload: bytes | None = None
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        if form is not None:
+            payload = urllib.parse.urlencode(form).encode()
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        elif body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+
+        if self.connection is None:
+            connection_class = (
+                http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            )
+            self.connection = connection_class(self.host, self.port, timeout=self.timeout)
+        try:
+            self.connection.request(method, path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class Account:
+    def __init__(self, email: str, token: str, project_ids: list[int]):
+        self.email = email
+        self.token = token
+        self.project_ids = project_ids
+
+
+def seed(base_url: str, users: int, projects: int, batch_size: int) -> list[Account]:
+    """Register ``users`` users and spread ``projects`` projects across them."""
+
+    client = Client(base_url)
+    run = uuid.uuid4().hex[:8]
+    expiration = (date.today() + timedelta(days=365)).isoformat()
+    accounts = []
+    for index in range(users):
+        email = f"bench_{run}_{index}@example.com"
+        status, body = client.request(
+            "POST",
+            "/auth/register",
+            {"email": email, "full_name": f"Bench User {index}", "password": PASSWORD},
+        )
+        _expect(status, 201, body)
+        status, body = client.request(
+            "POST", "/auth/token", form={"username": email, "password": PASSWORD}
+        )
+        _expect(status, 200, body)
+        accounts.append(Account(email, json.loads(body)["access_token"], []))
+
+    remaining = projects
+    for index, account in enumerate(accounts):
+        share = remaining // (len(accounts) - index)
+        remaining -= share
+        for offset in range(0, share, batch_size):
+            payload = [
+                {"name": f"Bench {i}", "description": "seeded", "expiration_date": expiration}
+                for i in range(offset, min(offset + batch_size, share))
+            ]
+            status, body = client.request("POST", "/projects/bulk", payload, token=account.token)
+            _expect(status, 201, body)
+            account.project_ids.extend(item["id"] for item in json.loads(body))
+    client.close()
+    return accounts
+
+
+def read_operation(client: Client, account: Account, rng: random.Random) -> tuple[str, int]:
+    if not account.project_ids or rng.random() < 0.5:
+        status, _ = client.request("GET", "/projects/?limit=20", token=account.token)
+        return "list", status
+    project_id = rng.choice(account.project_ids)
+    status, _ = client.request("GET", f"/projects/{project_id}", token=account.token)
+    return "get", status
+
+
+def write_operation(client: Client, account: Account, rng: random.Random) -> tuple[str, int]:
+    if not account.project_ids or rng.random() < 0.5:
+        status, body = client.request(
+            "POST",
+            "/projects/",
+            {
+                "name": f"Bench write {rng.random():.6f}",
+                "expiration_date": (date.today() + timedelta(days=30)).isoformat(),
+            },
+            token=account.token,
+        )
+        if status == 201:
+            account.project_ids.append(json.loads(body)["id"])
+        return "create", status
+    project_id = rng.choice(account.project_ids)
+    status, _ = client.request(
+        "PATCH",
+        f"/projects/{project_id}",
+        {"description": f"patched {rng.random():.6f}"},
+        token=account.token,
+    )
+    return "patch", status
+
+
+def login_operation(client: Client, account: Account, rng: random.Random) -> tuple[str, int]:
+    status, _ = client.request(
+        "POST", "/auth/token", form={"username": account.email, "password": PASSWORD}
+    )
+    return "login", status
+
+
+OPERATIONS: dict[str, Callable[[Client, Account, random.Random], tuple[str, int]]] = {
+    "read": read_operation,
+    "write": write_operation,
+    "login": login_operation,
+}
+
+
+def run_workload(
+    base_url: str,
+    workload: str,
+    accounts: list[Account],
+    concurrency: int,
+    duration: float,
+) -> dict[str, Any]:
+    """Drive ``workload`` from ``concurrency`` keep-alive clients for ``duration`` seconds."""
+
+    operation = OPERATIONS[workload]
+    samples: list[tuple[str, float, int]] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(seed_value: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed_value)
+        client = Client(base_url)
+        local: list[tuple[str, float, int]] = []
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            account = rng.choice(accounts)
+            started = time.perf_counter()
+            try:
+                name, status = operation(client, account, rng)
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                continue
+            local.append((name, time.perf_counter() - started, status))
+        client.close()
+        with lock:
+            samples.extend(local)
+            errors += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    by_operation: dict[str, list[float]] = {}
+    for name, latency, _ in samples:
+        by_operation.setdefault(name, []).append(latency)
+    failed = sum(1 for _, _, status in samples if status >= 400)
+    return {
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 3),
+        "requests": len(samples),
+        "failed_responses": failed,
+        "connection_errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": _percentiles([latency for _, latency, _ in samples]),
+        "operations": {
+            name: {"requests": len(latencies), "latency_ms": _percentiles(latencies)}
+            for name, latencies in sorted(by_operation.items())
+        },
+    }
+
+
+@contextmanager
+def in_process_server() -> Iterator[str]:
+    """Serve the app from a background Uvicorn thread and yield its base URL."""
+
+    if "DATABASE_URL" not in os.environ:
+        directory = tempfile.mkdtemp(prefix="project-registry-bench-")
+        os.environ["DATABASE_URL"] = f"sqlite:///{directory}/benchmark.db"
+
+    # Imported late so the environment above is what the settings pick up.
+    import uvicorn
+
+    from app import database
+    from app.main import create_app
+
+    database.Base.metadata.create_all(bind=database.get_engine())
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(), host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError("Uvicorn failed to start")
+        time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Project Registry API.")
+    parser.add_argument("--url", help="benchmark a running server instead of an in-process one")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--projects", type=int, default=1000, help="projects to seed in total")
+    parser.add_argument("--seed-batch-size", type=int, default=500)
+    parser.add_argument(
+        "--workloads",
+        default="read,write,login",
+        help=f"comma-separated subset of {', '.join(WORKLOADS)}",
+    )
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per workload")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    workloads = [name.strip() for name in args.workloads.split(",") if name.strip()]
+    unknown = sorted(set(workloads) - set(WORKLOADS))
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(unknown)}")
+
+    with _target(args.url) as base_url:
+        seed_started = time.perf_counter()
+        accounts = seed(base_url, args.users, args.projects, args.seed_batch_size)
+        report: dict[str, Any] = {
+            "target": args.url or f"in-process ({os.environ['DATABASE_URL']})",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "users": args.users,
+            "projects": args.projects,
+            "seed_seconds": round(time.perf_counter() - seed_started, 3),
+            "workloads": {},
+        }
+        for workload in workloads:
+            report["workloads"][workload] = run_workload(
+                base_url, workload, accounts, args.concurrency, args.duration
+            )
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(rendered + "\n")
+    else:
+        print(rendered)
+    return 0
+
+
+@contextmanager
+def _target(url: str | None) -> Iterator[str]:
+    if url:
+        yield url.rstrip("/")
+        return
+    with in_process_server() as base_url:
+        yield base_url
+
+
+def _percentiles(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(latencies)
+
+    def rank(fraction: float) -> float:
+        index = max(0, min(len(ordered) - 1, round(fraction * len(ordered)) - 1))
+        return round(ordered[index] * 1000, 2)
+
+    return {
+        "p50": rank(0.50),
+        "p95": rank(0.95),
+        "p99": rank(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+def _expect(status: int, expected: int, body: bytes) -> None:
+    if status != expected:
+        raise RuntimeError(f"Unexpected status {status}: {body[:200]!r}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Bulk-load projects for one owner from a CSV or NDJSON file.
+
+Rows are validated with ``schemas.ProjectCreate`` a batch at a time and loaded with
+``COPY`` on Postgres (psycopg) or chunked ``executemany`` elsewhere. Progress is
+committed with every batch, so rerunning the same command resumes after a failure:
+
+    uv run python -m scripts.bulk_import projects.csv --owner-email lead@example.com
+    uv run python -m scripts.bulk_import projects.ndjson --owner-email lead@example.com \\
+        --batch-size 10000 --import-id team-a-2026
+"""
+
+import argparse
+import csv
+import logging
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple, Sequence
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.cache import invalidate_owners_from_job
+from app.database import get_sessionmaker
+from app.service import UserService
+from app.stats import record_changes
+
+logger = logging.getLogger("scripts.bulk_import")
+
+PROJECT_CREATE = TypeAdapter(schemas.ProjectCreate)
+COPY_COLUMNS = ("name", "description", "expiration_date", "owner_id")
+
+
+class ImportReport(NamedTuple):
+    records: int
+    loaded: int
+    rejected: int
+    skipped: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.loaded / self.seconds if self.seconds > 0 else 0.0
+
+
+def read_records(path: Path, file_format: str) -> Iterator[Any]:
+    """Yield raw records one at a time: dicts for CSV, undecoded lines for NDJSON."""
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        if file_format == "csv":
+            for row in csv.DictReader(handle):
+                # Empty CSV cells mean "not set", e.g. a missing description.
+                yield {key: value for key, value in row.items() if value != ""}
+        else:
+            for line in handle:
+                if line.strip():
+                    yield line
+
+
+def import_projects(
+    db: Session,
+    path: Path,
+    owner_id: int,
+    import_id: str,
+    file_format: str = "csv",
+    batch_size: int = 5000,
+) -> ImportReport:
+    """Load ``path`` into ``projects`` for ``owner_id``, resuming from ``import_id``'s checkpoint.
+
+    Only one batch of records is held in memory. Each batch and the checkpoint that counts
+    it commit together, so a crash never loads a record twice or skips one.
+    """
+
+    checkpoint = db.get(models.ProjectImport, import_id)
+    if checkpoint is None:
+        checkpoint = models.ProjectImport(
+            import_id=import_id, records_done=0, rows_loaded=0, rows_rejected=0
+        )
+        db.add(checkpoint)
+    skipped = checkpoint.records_done
+    if skipped:
+        logger.info("resuming %s after %d records", import_id, skipped)
+
+    records = loaded = rejected = 0
+    started = time.perf_counter()
+    source = islice(read_records(path, file_format), skipped, None)
+    while batch := list(islice(source, batch_size)):
+        projects = []
+        for offset, record in enumerate(batch):
+            try:
+                if isinstance(record, str):
+                    projects.append(PROJECT_CREATE.validate_json(record))
+                else:
+                    projects.append(PROJECT_CREATE.validate_python(record))
+            except ValidationError as exc:
+                rejected += 1
+                logger.warning(
+                    "record %d rejected: %s",
+                    skipped + records + offset + 1,
+                    "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()),
+                )
+
+        _load(db, projects, owner_id)
+        record_changes(db, [(owner_id, project.expiration_date, 1) for project in projects])
+        checkpoint.records_done += len(batch)
+        checkpoint.rows_loaded += len(projects)
+        checkpoint.rows_rejected += len(batch) - len(projects)
+        db.commit()
+
+        records += len(batch)
+        loaded += len(projects)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "%d records read, %d loaded, %d rejected (%.0f rows/s)",
+            skipped + records,
+            loaded,
+            rejected,
+            loaded / elapsed if elapsed > 0 else 0.0,
+        )
+
+    db.commit()
+    if loaded:
+        invalidate_owners_from_job([owner_id])
+    return ImportReport(records, loaded, rejected, skipped, time.perf_counter() - started)
+
+
+def _load(db: Session, projects: Sequence[schemas.ProjectCreate], owner_id: int) -> None:
+    if not projects:
+        return
+    connection = db.connection()
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "psycopg":
+        # COPY streams rows over the session's own connection, so it shares the
+        # transaction with the stats and checkpoint updates.
+        with connection.connection.dbapi_connection.cursor() as cursor:
+            with cursor.copy(f"COPY projects ({', '.join(COPY_COLUMNS)}) FROM STDIN") as copy:
+                for project in projects:
+                    copy.write_row(
+                        (project.name, project.description, project.expiration_date, owner_id)
+                    )
+        return
+    db.execute(
+        insert(models.Project.__table__),
+        [{**project.model_dump(), "owner_id": owner_id} for project in projects],
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="CSV with a header row, or NDJSON")
+    parser.add_argument("--owner-email", required=True, help="user who will own the projects")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="default: file extension")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--import-id",
+        help="checkpoint name; reuse it to resume (default: owner email and file name)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    file_format = args.format or ("ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv")
+    import_id = args.import_id or f"{args.owner_email}:{args.path.name}"
+    with get_sessionmaker()() as db:
+        owner = UserService(db).get_by_email(args.owner_email)
+        if owner is None:
+            logger.error("no user with email %s", args.owner_email)
+            return 1
+        report = import_projects(db, args.path, owner.id, import_id, file_format, args.batch_size)
+    logger.info(
+        "done: %d records (%d skipped as already imported), %d loaded, %d rejected, "
+        "%.1fs (%.0f rows/s)",
+        report.records,
+        report.skipped,
+        report.loaded,
+        report.rejected,
+        report.seconds,
+        report.rows_per_second,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
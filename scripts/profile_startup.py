@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Report per-module import cost and app startup time for a fresh interpreter.
+
+    uv run python scripts/profile_startup.py --top 25
+    uv run python scripts/profile_startup.py --json > startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in the child interpreter under ``-X importtime``; phase timings go to stdout.
+PROBE = """
+import asyncio, json, time
+started = time.perf_counter()
+import app.main
+imported = time.perf_counter()
+application = app.main.create_app()
+created = time.perf_counter()
+
+async def run_lifespan():
+    async with application.router.lifespan_context(application):
+        ready = time.perf_counter()
+    return ready
+
+ready = asyncio.run(run_lifespan()) if {lifespan} else created
+print(json.dumps({{
+    "import_app_main_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "lifespan_startup_ms": (ready - created) * 1000,
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> list[dict[str, object]]:
+    """Parse ``-X importtime`` output into records with self and cumulative microseconds."""
+
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        records.append(
+            {
+                "module": name.strip(),
+                "depth": (len(name) - len(name.lstrip())) // 2,
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    return records
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20, help="modules to list by cumulative cost")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    parser.add_argument(
+        "--no-lifespan",
+        action="store_true",
+        help="skip running the lifespan startup (engine construction and warm-up)",
+    )
+    args = parser.parse_args()
+
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(lifespan=not args.no_lifespan)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return result.returncode
+
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    modules = parse_importtime(result.stderr)
+    top_level = [record for record in modules if record["depth"] == 0]
+    report = {
+        "phases_ms": {name: round(value, 2) for name, value in phases.items()},
+        "modules_imported": len(modules),
+        "top_level_imports": sorted(top_level, key=lambda r: -r["cumulative_ms"])[: args.top],
+        "app_modules": [record for record in modules if str(record["module"]).startswith("app")],
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    for name, value in report["phases_ms"].items():
+        print(f"{name:<24} {value:>10.1f} ms")
+    print(f"\n{report['modules_imported']} modules imported; top-level by cumulative cost:")
+    for record in report["top_level_imports"]:
+        print(f"  {record['cumulative_ms']:>9.1f} ms  {record['module']}")
+    print("\napp modules (self / cumulative):")
+    for record in report["app_modules"]:
+        print(f"  {record['self_ms']:>7.1f} / {record['cumulative_ms']:>7.1f} ms  {record['module']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,13 +3,30 @@ from collections.abc import Generator
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.database import Base, get_db
+from app import models  # noqa: F401 - registers the tables on Base.metadata
+from app.cache import get_project_cache, get_recent_writers, get_user_cache
+from app.config import get_settings
+from app.database import Base, get_async_db, get_db
 from app.main import create_app
+from app.security import get_token_cache
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, None, None]:
+    # Process-wide caches would otherwise leak users between rolled-back tests.
+    caches = (get_user_cache(), get_token_cache(), get_project_cache(), get_recent_writers())
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
 
 
 @pytest.fixture(scope="session")
@@ -55,3 +72,33 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         yield test_client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def async_client() -> Generator[TestClient, None, None]:
+    settings = get_settings().model_copy(update={"db_async": True})
+    app = create_app(settings)
+    async_engine = create_async_engine(
+        TEST_ASYNC_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as test_client:
+        # The in-memory database must be created on the loop the app runs on.
+        test_client.portal.call(_create_schema, async_engine)
+        yield test_client
+        test_client.portal.call(async_engine.dispose)
+
+    app.dependency_overrides.clear()
+
+
+async def _create_schema(async_engine: AsyncEngine) -> None:
+    async with async_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
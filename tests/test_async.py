@@ -0,0 +1,65 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import service
+from tests.test_projects import obtain_token, register_user
+
+
+def test_async_project_crud_flow(async_client: TestClient) -> None:
+    register_user(async_client)
+    token = obtain_token(async_client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+
+    for index in range(3):
+        create_response = async_client.post(
+            "/projects/",
+            json={"name": f"Async {index}", "expiration_date": expiration},
+            headers=headers,
+        )
+        assert create_response.status_code == 201, create_response.text
+    project_id = create_response.json()["id"]
+
+    first_page = async_client.get("/projects/", params={"limit": 2}, headers=headers)
+    assert first_page.status_code == 200
+    assert [project["name"] for project in first_page.json()] == ["Async 2", "Async 1"]
+    second_page = async_client.get(
+        "/projects/",
+        params={"limit": 2, "after": first_page.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [project["name"] for project in second_page.json()] == ["Async 0"]
+
+    update_response = async_client.patch(
+        f"/projects/{project_id}",
+        json={"description": "Updated asynchronously"},
+        headers=headers,
+    )
+    assert update_response.status_code == 200
+    assert update_response.json()["description"] == "Updated asynchronously"
+
+    export_response = async_client.get("/projects/export", headers=headers)
+    assert export_response.status_code == 200
+    assert len(export_response.text.splitlines()) == 3
+
+    delete_response = async_client.delete(f"/projects/{project_id}", headers=headers)
+    assert delete_response.status_code == 204
+    assert async_client.get(f"/projects/{project_id}", headers=headers).status_code == 404
+
+
+def test_async_duplicate_registration_skips_hashing(
+    async_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    register_user(async_client)
+
+    async def unexpected_hash(password: str) -> str:
+        raise AssertionError("hashed a password for a duplicate email")
+
+    monkeypatch.setattr(service, "get_password_hash_async", unexpected_hash)
+    duplicate = async_client.post(
+        "/auth/register",
+        json={"email": "alice@example.com", "full_name": "Alice Again", "password": "S3curePass!"},
+    )
+    assert duplicate.status_code == 400
@@ -0,0 +1,103 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import security
+from app.cache import get_user_cache
+from app.security import create_access_token, decode_access_token, get_token_cache
+from app.service import UserService
+from tests.test_projects import obtain_token, register_user
+
+
+def test_current_user_is_cached_and_invalidated(client: TestClient, db_session: Session) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/projects/", headers=headers).status_code == 200
+    assert client.get("/projects/", headers=headers).status_code == 200
+    stats = get_user_cache().stats()
+    assert stats["hits"] >= 1
+    assert stats["size"] == 1
+
+    UserService(db_session).deactivate_user("alice@example.com")
+    assert get_user_cache().stats()["size"] == 0
+
+    response = client.get("/projects/", headers=headers)
+    assert response.status_code == 403
+
+
+def test_decode_access_token_caches_verified_payloads() -> None:
+    token = create_access_token("cached@example.com")
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == second["sub"] == "cached@example.com"
+    stats = get_token_cache().stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    expired = create_access_token("expired@example.com", expires_delta=timedelta(seconds=-1))
+    with pytest.raises(ValueError):
+        decode_access_token(expired)
+    assert get_token_cache().stats()["size"] == 1
+
+
+def test_login_fails_fast_when_hashing_queue_is_full(
+    client: TestClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    register_user(client)
+
+    executor = security.PasswordHashExecutor(workers=1, max_pending=0)
+    release = threading.Event()
+    executor.submit(release.wait)
+    monkeypatch.setattr(security, "get_password_hash_executor", lambda: executor)
+    try:
+        response = client.post(
+            "/auth/token",
+            data={"username": "alice@example.com", "password": "S3curePass!"},
+        )
+    finally:
+        release.set()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_login_rehashes_when_policy_changes(
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(security, "get_password_hasher", lambda: security.BcryptHasher(rounds=5))
+    register_user(client)
+    user_service = UserService(db_session)
+    assert user_service.get_by_email("alice@example.com").hashed_password.startswith("$2b$05$")
+
+    monkeypatch.setattr(security, "get_password_hasher", lambda: security.BcryptHasher(rounds=4))
+    obtain_token(client)
+    assert user_service.get_by_email("alice@example.com").hashed_password.startswith("$2b$04$")
+
+    pbkdf2 = security.Pbkdf2Hasher(iterations=1_000)
+    monkeypatch.setattr(security, "get_password_hasher", lambda: pbkdf2)
+    obtain_token(client)
+    stored = user_service.get_by_email("alice@example.com").hashed_password
+    assert pbkdf2.identifies(stored)
+    assert not security.password_needs_rehash(stored)
+    obtain_token(client)
+
+
+def test_incomplete_password_hasher_fails_on_instantiation() -> None:
+    class VerifyOnlyHasher(security.PasswordHasher):
+        scheme = "verify-only"
+
+        def verify(self, password: str, hashed_password: str) -> bool:
+            return False
+
+    with pytest.raises(TypeError):
+        VerifyOnlyHasher()
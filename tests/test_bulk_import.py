@@ -0,0 +1,49 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.stats import verify_project_stats
+from scripts import bulk_import
+
+
+def test_bulk_import_resumes_after_a_failed_batch(
+    db_session: Session, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    owner = models.User(email="lead@example.com", full_name="Lead", hashed_password="x")
+    db_session.add(owner)
+    db_session.commit()
+
+    path = tmp_path / "projects.ndjson"
+    records = [{"name": f"P{i}", "expiration_date": "2030-01-01"} for i in range(7)]
+    records[3] = {"name": "Broken", "expiration_date": "not a date"}
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n{oops\n")
+
+    load = bulk_import._load
+    calls = 0
+
+    def failing_load(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("connection lost")
+        load(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_import, "_load", failing_load)
+    with pytest.raises(RuntimeError):
+        bulk_import.import_projects(db_session, path, owner.id, "team", "ndjson", batch_size=3)
+    db_session.rollback()
+
+    report = bulk_import.import_projects(db_session, path, owner.id, "team", "ndjson", batch_size=3)
+    assert (report.skipped, report.records, report.loaded, report.rejected) == (6, 2, 1, 1)
+
+    names = db_session.scalars(
+        select(models.Project.name).where(models.Project.owner_id == owner.id)
+    ).all()
+    assert sorted(names) == ["P0", "P1", "P2", "P4", "P5", "P6"]
+    checkpoint = db_session.get(models.ProjectImport, "team")
+    assert (checkpoint.records_done, checkpoint.rows_loaded, checkpoint.rows_rejected) == (8, 6, 2)
+    assert verify_project_stats(db_session).mismatched == 0
+    assert db_session.scalar(select(func.count()).select_from(models.Project)) == 6
@@ -0,0 +1,120 @@
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.orm import Session
+
+from app import models
+from app.config import get_settings
+from app.database import Base, engine_options
+from app.partitioning import partitions_in_plan, project_partitions_ddl
+from app.pool import instrument_engine, pool_status, statement_cache_status
+from app.service import ProjectService, UserService
+
+
+def test_engine_options_follow_settings() -> None:
+    settings = get_settings().model_copy(
+        update={"db_pool_size": 3, "db_pool_pre_ping": False, "db_statement_timeout_ms": 500}
+    )
+
+    options = engine_options("postgresql+psycopg://user@db/app", settings)
+    assert options["pool_size"] == 3
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {
+        "options": "-c statement_timeout=500",
+        "prepare_threshold": 5,
+    }
+    assert engine_options("sqlite:///:memory:", settings) == {
+        "pool_pre_ping": False,
+        "query_cache_size": 500,
+    }
+
+    unprepared = settings.model_copy(update={"db_prepared_statements": False})
+    options = engine_options("postgresql+psycopg://user@db/app", unprepared)
+    assert options["connect_args"]["prepare_threshold"] is None
+
+
+def test_instrumented_pool_reports_checkouts_and_timeouts(tmp_path) -> None:
+    settings = get_settings().model_copy(
+        update={"db_pool_size": 1, "db_max_overflow": 0, "db_pool_timeout_seconds": 0.05}
+    )
+    options = engine_options("postgresql+psycopg://user@db/app", settings)
+    options.pop("connect_args", None)
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", **options)
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert pool_status(engine)["in_use"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool_status(engine)
+    assert stats["checkouts"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["in_use"] == 0
+    assert stats["wait_seconds_max"] >= 0.05
+    engine.dispose()
+
+
+def test_importing_the_app_does_not_build_engines() -> None:
+    probe = (
+        "import app.main, app.database as d;"
+        "assert d.get_engine.cache_info().currsize == 0;"
+        "assert d.get_sessionmaker.cache_info().currsize == 0;"
+        "assert 'app.views' not in __import__('sys').modules"
+    )
+    subprocess.run([sys.executable, "-c", probe], check=True)
+
+
+def test_hot_queries_reuse_compiled_sql(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    instrument_engine(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        owner = models.User(email="a@example.com", full_name="A", hashed_password="x")
+        db.add(owner)
+        db.flush()
+        db.add_all(
+            models.Project(name=f"P{i}", expiration_date=date(2030, 1, 1), owner_id=owner.id)
+            for i in range(3)
+        )
+        db.commit()
+
+        before = statement_cache_status(engine)
+        users, projects = UserService(db), ProjectService(db)
+        assert users.get_by_email("a@example.com").id == owner.id
+        assert users.get_by_email("b@example.com") is None
+        assert len(projects.fetch_projects_page(owner.id, limit=5)[0]) == 3
+        first_page, cursor = projects.fetch_projects_page(owner.id, limit=2)
+        stats = statement_cache_status(engine)
+
+        second_page, _ = projects.fetch_projects_page(owner.id, limit=2, after=cursor)
+        assert len(first_page) == 2 and len(second_page) == 1
+        assert second_page[0].id not in {project.id for project in first_page}
+
+    # Each query shape compiles once; repeats with new parameters are cache hits.
+    assert stats["misses"] - before["misses"] == 2
+    assert stats["hits"] - before["hits"] == 2
+    engine.dispose()
+
+
+def test_partition_ddl_and_plan_inspection() -> None:
+    assert project_partitions_ddl("projects", 2) == [
+        "CREATE TABLE projects_p0 PARTITION OF projects FOR VALUES WITH (MODULUS 2, REMAINDER 0)",
+        "CREATE TABLE projects_p1 PARTITION OF projects FOR VALUES WITH (MODULUS 2, REMAINDER 1)",
+    ]
+    plan = [
+        {
+            "Plan": {
+                "Node Type": "Append",
+                "Plans": [
+                    {"Node Type": "Index Scan", "Relation Name": "projects_p3"},
+                    {"Node Type": "Seq Scan", "Relation Name": "project_expiration_counts"},
+                ],
+            }
+        }
+    ]
+    assert partitions_in_plan(plan) == {"projects_p3"}
@@ -0,0 +1,50 @@
+import logging
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.database import get_db
+from app.main import create_app
+from app.metrics import get_metrics_registry
+
+
+@pytest.fixture
+def metrics_client(db_session: Session) -> Generator[TestClient, None, None]:
+    settings = get_settings().model_copy(update={"metrics_enabled": True, "slow_request_ms": 0})
+    app = create_app(settings)
+    app.dependency_overrides[get_db] = lambda: db_session
+    get_metrics_registry().clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    get_metrics_registry().clear()
+
+
+def test_metrics_report_route_latency_and_queries(
+    metrics_client: TestClient, caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.WARNING, logger="app.metrics"):
+        response = metrics_client.post(
+            "/auth/register",
+            json={"email": "bob@example.com", "full_name": "Bob", "password": "S3curePass!"},
+        )
+    assert response.status_code == 201
+    assert "slow request POST /auth/register" in caplog.text
+    assert "INSERT INTO users" in caplog.text
+
+    metrics_client.get("/projects/42")
+
+    body = metrics_client.get("/metrics").text
+    assert 'http_requests_total{method="POST",route="/auth/register",status="201"} 1' in body
+    assert 'http_requests_total{method="GET",route="/projects/{project_id}",status="401"} 1' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/auth/register"} 1' in body
+    queries = next(
+        line
+        for line in body.splitlines()
+        if line.startswith('http_request_db_queries_sum{method="POST",route="/auth/register"}')
+    )
+    assert float(queries.rsplit(" ", 1)[1]) >= 2
+    assert 'cache_misses{cache="user"}' in body
+    assert 'cache_hit_rate{cache="project"}' in body
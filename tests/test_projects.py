@@ -1,6 +1,29 @@
-from datetime import date, timedelta
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import dependencies, models
+from app.archive import archive_expired_projects
+from app.cache import (
+    ProjectCache,
+    TTLCache,
+    get_project_cache,
+    get_recent_writers,
+    invalidate_owners_from_job,
+)
+from app.config import get_settings
+from app.database import Base, ReadReplicas, get_db
+from app.main import create_app
+from app.stats import all_owners_shard, verify_project_stats
+from app.sweeper import sweep_expired_projects
 
 
 def register_user(client: TestClient) -> None:
@@ -54,9 +77,547 @@ def test_project_crud_flow(client: TestClient) -> None:
     assert update_response.status_code == 200
     assert update_response.json()["description"] == "Updated description"
 
+    for field in ("name", "expiration_date"):
+        null_update = client.patch(f"/projects/{project_id}", json={field: None}, headers=headers)
+        assert null_update.status_code == 422, null_update.text
+    cleared = client.patch(f"/projects/{project_id}", json={"description": None}, headers=headers)
+    assert cleared.status_code == 200
+    assert cleared.json()["description"] is None
+
     delete_response = client.delete(f"/projects/{project_id}", headers=headers)
     assert delete_response.status_code == 204
 
     empty_response = client.get("/projects/", headers=headers)
     assert empty_response.status_code == 200
     assert empty_response.json() == []
+
+
+def test_project_list_keyset_pagination(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created_ids = []
+    for index in range(5):
+        response = client.post(
+            "/projects/",
+            json={
+                "name": f"Project {index}",
+                "expiration_date": (date.today() + timedelta(days=30)).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+        created_ids.append(response.json()["id"])
+
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        page = client.get("/projects/", params=params, headers=headers)
+        assert page.status_code == 200, page.text
+        assert len(page.json()) <= 2
+        seen_ids.extend(project["id"] for project in page.json())
+        next_cursor = page.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "after": next_cursor}
+
+    assert seen_ids == list(reversed(created_ids))
+
+    invalid = client.get("/projects/", params={"after": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
+
+
+def test_project_export_streams_ndjson_and_csv(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for index in range(3):
+        response = client.post(
+            "/projects/",
+            json={
+                "name": f"Export {index}",
+                "description": "line one\nline two",
+                "expiration_date": (date.today() + timedelta(days=7)).isoformat(),
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+
+    ndjson_response = client.get("/projects/export", headers=headers)
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in ndjson_response.text.splitlines()]
+    assert [record["name"] for record in records] == ["Export 2", "Export 1", "Export 0"]
+
+    csv_response = client.get("/projects/export", params={"format": "csv"}, headers=headers)
+    assert csv_response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert len(rows) == 3
+    assert rows[0]["description"] == "line one\nline two"
+
+
+def test_project_bulk_endpoints(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+
+    create_response = client.post(
+        "/projects/bulk",
+        json=[{"name": f"Bulk {index}", "expiration_date": expiration} for index in range(3)],
+        headers=headers,
+    )
+    assert create_response.status_code == 201, create_response.text
+    created = create_response.json()
+    assert [item["status"] for item in created] == ["created"] * 3
+    assert [item["project"]["name"] for item in created] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    ids = [item["id"] for item in created]
+
+    update_response = client.patch(
+        "/projects/bulk",
+        json=[
+            {"id": ids[0], "description": "first"},
+            {"id": ids[1], "name": "Renamed"},
+            {"id": 999_999, "name": "Missing"},
+        ],
+        headers=headers,
+    )
+    assert update_response.status_code == 200, update_response.text
+    updated = update_response.json()
+    assert [item["status"] for item in updated] == ["updated", "updated", "not_found"]
+    assert updated[0]["project"]["description"] == "first"
+    assert updated[1]["project"]["name"] == "Renamed"
+
+    null_update = client.patch(
+        "/projects/bulk",
+        json=[{"id": ids[0], "name": "ok"}, {"id": ids[1], "expiration_date": None}],
+        headers=headers,
+    )
+    assert null_update.status_code == 422
+
+    delete_response = client.request(
+        "DELETE",
+        "/projects/bulk",
+        json=[ids[0], ids[2], 999_999],
+        headers=headers,
+    )
+    assert delete_response.status_code == 200, delete_response.text
+    statuses = [item["status"] for item in delete_response.json()]
+    assert statuses == ["deleted", "deleted", "not_found"]
+
+    remaining = client.get("/projects/", headers=headers).json()
+    assert [project["id"] for project in remaining] == [ids[1]]
+
+
+def test_project_conditional_requests(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    create_response = client.post(
+        "/projects/",
+        json={
+            "name": "Dashboard",
+            "expiration_date": (date.today() + timedelta(days=30)).isoformat(),
+        },
+        headers=headers,
+    )
+    project_id = create_response.json()["id"]
+
+    detail = client.get(f"/projects/{project_id}", headers=headers)
+    etag = detail.headers["ETag"]
+    assert "Last-Modified" in detail.headers
+    revalidated = client.get(f"/projects/{project_id}", headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+
+    listing = client.get("/projects/", headers=headers)
+    list_tag = listing.headers["ETag"]
+    unchanged = client.get("/projects/", headers={**headers, "If-None-Match": list_tag})
+    assert unchanged.status_code == 304
+
+    stale = client.patch(
+        f"/projects/{project_id}",
+        json={"description": "stale write"},
+        headers={**headers, "If-Match": '"p0-0"'},
+    )
+    assert stale.status_code == 412
+
+    updated = client.patch(
+        f"/projects/{project_id}",
+        json={"description": "fresh write"},
+        headers={**headers, "If-Match": etag},
+    )
+    assert updated.status_code == 200, updated.text
+    assert updated.headers["ETag"] != etag
+
+    changed = client.get("/projects/", headers={**headers, "If-None-Match": list_tag})
+    assert changed.status_code == 200
+    assert changed.json()[0]["description"] == "fresh write"
+
+    stale_delete = client.delete(f"/projects/{project_id}", headers={**headers, "If-Match": etag})
+    assert stale_delete.status_code == 412
+    fresh_delete = client.delete(
+        f"/projects/{project_id}",
+        headers={**headers, "If-Match": updated.headers["ETag"]},
+    )
+    assert fresh_delete.status_code == 204
+
+
+def test_project_reads_are_cached_until_a_write(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+
+    created = client.post(
+        "/projects/",
+        json={"name": "Cached", "expiration_date": expiration},
+        headers=headers,
+    ).json()
+
+    cache = get_project_cache()
+    assert client.get("/projects/", headers=headers).status_code == 200
+    assert client.get(f"/projects/{created['id']}", headers=headers).status_code == 200
+    hits_before = cache.stats()["hits"]
+    assert len(client.get("/projects/", headers=headers).json()) == 1
+    assert client.get(f"/projects/{created['id']}", headers=headers).json()["name"] == "Cached"
+    assert cache.stats()["hits"] >= hits_before + 3
+
+    client.patch(f"/projects/{created['id']}", json={"name": "Renamed"}, headers=headers)
+    assert client.get(f"/projects/{created['id']}", headers=headers).json()["name"] == "Renamed"
+    assert client.get("/projects/", headers=headers).json()[0]["name"] == "Renamed"
+
+    client.post(
+        "/projects/bulk",
+        json=[{"name": "Second", "expiration_date": expiration}],
+        headers=headers,
+    )
+    assert len(client.get("/projects/", headers=headers).json()) == 2
+
+
+def test_project_search_ranks_and_paginates(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+
+    client.post(
+        "/projects/bulk",
+        json=[
+            {
+                "name": "Warehouse loader",
+                "description": "nightly batch",
+                "expiration_date": expiration,
+            },
+            {
+                "name": "Billing",
+                "description": "invoices for the warehouse",
+                "expiration_date": expiration,
+            },
+            {"name": "Marketing site", "expiration_date": expiration},
+        ],
+        headers=headers,
+    )
+
+    results = client.get("/projects/search", params={"q": "wareh"}, headers=headers)
+    assert results.status_code == 200, results.text
+    assert {project["name"] for project in results.json()} == {"Warehouse loader", "Billing"}
+
+    first = client.get("/projects/search", params={"q": "warehouse", "limit": 1}, headers=headers)
+    assert len(first.json()) == 1
+    assert first.headers["X-Next-Offset"] == "1"
+    second = client.get(
+        "/projects/search",
+        params={"q": "warehouse", "limit": 1, "offset": 1},
+        headers=headers,
+    )
+    assert "X-Next-Offset" not in second.headers
+    assert first.json()[0]["id"] != second.json()[0]["id"]
+
+    client.patch(
+        f"/projects/{second.json()[0]['id']}", json={"description": "renamed"}, headers=headers
+    )
+    refreshed = client.get("/projects/search", params={"q": "warehouse"}, headers=headers)
+    assert [project["name"] for project in refreshed.json()] == ["Warehouse loader"]
+    assert client.get("/projects/search", params={"q": "%%"}, headers=headers).json() == []
+
+
+def test_expiring_projects_and_sweeper(client: TestClient, db_session: Session) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    today = date.today()
+
+    client.post(
+        "/projects/bulk",
+        json=[
+            {"name": f"Due {days}", "expiration_date": (today + timedelta(days=days)).isoformat()}
+            for days in (20, 3, 90, 7)
+        ],
+        headers=headers,
+    )
+    expiring = client.get(
+        "/projects/expiring", params={"within_days": 30, "limit": 2}, headers=headers
+    )
+    assert [project["name"] for project in expiring.json()] == ["Due 3", "Due 7"]
+    rest = client.get(
+        "/projects/expiring",
+        params={"within_days": 30, "limit": 2, "after": expiring.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [project["name"] for project in rest.json()] == ["Due 20"]
+    assert "X-Next-Cursor" not in rest.headers
+
+    as_of = today + timedelta(days=21)
+    report = sweep_expired_projects(db_session, as_of=as_of, batch_size=2)
+    assert (report.scanned, report.deleted, report.batches) == (3, 0, 2)
+
+    report = sweep_expired_projects(db_session, as_of=as_of, batch_size=2, remove=True)
+    assert (report.scanned, report.deleted) == (3, 3)
+    assert verify_project_stats(db_session).mismatched == 0
+    assert [project["name"] for project in client.get("/projects/", headers=headers).json()] == [
+        "Due 90"
+    ]
+
+
+def test_fast_json_responses_match_response_model_output(
+    client: TestClient, db_session: Session
+) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        "/projects/",
+        json={"name": "Fast", "expiration_date": (date.today() + timedelta(days=5)).isoformat()},
+        headers=headers,
+    )
+    assert created.status_code == 201
+    assert created.headers["content-type"] == "application/json"
+
+    settings = get_settings().model_copy(update={"fast_json_responses": False})
+    slow_app = create_app(settings)
+    slow_app.dependency_overrides[get_db] = lambda: db_session
+    with TestClient(slow_app) as slow_client:
+        for path in ("/projects/", f"/projects/{created.json()['id']}"):
+            fast = client.get(path, headers=headers)
+            slow = slow_client.get(path, headers=headers)
+            assert fast.json() == slow.json()
+            assert fast.headers["ETag"] == slow.headers["ETag"]
+
+
+def test_reads_use_replicas_outside_the_read_your_writes_window(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = date.today() + timedelta(days=30)
+    created = client.post(
+        "/projects/",
+        json={"name": "Primary", "expiration_date": expiration.isoformat()},
+        headers=headers,
+    ).json()
+
+    replica_engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=replica_engine)
+    with Session(replica_engine) as replica:
+        replica.execute(
+            insert(models.Project).values(
+                name="Replica", expiration_date=expiration, owner_id=created["owner_id"]
+            )
+        )
+        replica.commit()
+    replicas = ReadReplicas([sessionmaker(bind=replica_engine)])
+    monkeypatch.setattr(dependencies, "get_read_replicas", lambda: replicas)
+
+    # The owner just wrote, so their reads stay on the primary.
+    assert [p["name"] for p in client.get("/projects/", headers=headers).json()] == ["Primary"]
+
+    get_recent_writers().clear()
+    get_project_cache().clear()
+    assert [p["name"] for p in client.get("/projects/", headers=headers).json()] == ["Replica"]
+    replica_engine.dispose()
+
+
+def test_project_export_streams_across_fetch_batches(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=7)).isoformat()
+
+    # 1200 rows span three yield_per=500 fetches and several 200-row chunks.
+    created_ids = []
+    for start in (0, 600):
+        response = client.post(
+            "/projects/bulk",
+            json=[
+                {"name": f"Export {index}", "expiration_date": expiration}
+                for index in range(start, start + 600)
+            ],
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+        created_ids.extend(item["id"] for item in response.json())
+
+    with client.stream("GET", "/projects/export", headers=headers) as ndjson_response:
+        assert ndjson_response.status_code == 200
+        records = [json.loads(line) for line in ndjson_response.iter_lines() if line]
+    assert sorted(record["id"] for record in records) == sorted(created_ids)
+    assert len({record["id"] for record in records}) == 1200
+
+    csv_response = client.get("/projects/export", params={"format": "csv"}, headers=headers)
+    rows = list(csv.DictReader(io.StringIO(csv_response.text)))
+    assert [int(row["id"]) for row in rows] == [record["id"] for record in records]
+
+
+def test_if_match_is_checked_by_the_write_itself(client: TestClient, db_session: Session) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    project_id = client.post(
+        "/projects/",
+        json={"name": "Shared", "expiration_date": (date.today() + timedelta(days=30)).isoformat()},
+        headers=headers,
+    ).json()["id"]
+    etag = client.get(f"/projects/{project_id}", headers=headers).headers["ETag"]
+
+    first = client.patch(
+        f"/projects/{project_id}", json={"name": "First"}, headers={**headers, "If-Match": etag}
+    )
+    assert first.status_code == 200
+    second = client.patch(
+        f"/projects/{project_id}", json={"name": "Second"}, headers={**headers, "If-Match": etag}
+    )
+    assert second.status_code == 412
+
+    # Another worker's write leaves this worker's cached version behind.
+    current = first.headers["ETag"]
+    cached = client.get(f"/projects/{project_id}", headers={**headers, "If-None-Match": current})
+    assert cached.status_code == 304
+    db_session.execute(
+        update(models.Project)
+        .where(models.Project.id == project_id)
+        .values(name="Elsewhere", updated_at=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    )
+    stale = client.patch(
+        f"/projects/{project_id}", json={"name": "Lost"}, headers={**headers, "If-Match": current}
+    )
+    assert stale.status_code == 412
+    missing = client.delete("/projects/999999", headers={**headers, "If-Match": current})
+    assert missing.status_code == 404
+    forced = client.delete(f"/projects/{project_id}", headers={**headers, "If-Match": "*"})
+    assert forced.status_code == 204
+
+
+def test_project_stats_follow_every_write(client: TestClient, db_session: Session) -> None:
+    register_user(client)
+    headers = {"Authorization": f"Bearer {obtain_token(client)}"}
+    today = date.today()
+
+    def due(days: int) -> str:
+        return (today + timedelta(days=days)).isoformat()
+
+    created = client.post(
+        "/projects/bulk",
+        json=[{"name": f"P{days}", "expiration_date": due(days)} for days in (-2, 3, 10, 40)],
+        headers=headers,
+    ).json()
+    ids = [item["id"] for item in created]
+    client.post("/projects/", json={"name": "Soon", "expiration_date": due(1)}, headers=headers)
+    client.patch(f"/projects/{ids[3]}", json={"expiration_date": due(5)}, headers=headers)
+    client.patch(
+        "/projects/bulk",
+        json=[{"id": ids[2], "expiration_date": due(-1)}, {"id": ids[1], "name": "Renamed"}],
+        headers=headers,
+    )
+    client.delete(f"/projects/{ids[0]}", headers=headers)
+
+    stats = client.get("/projects/stats", headers=headers).json()
+    expected = {"expired": 1, "within_7_days": 3, "within_30_days": 0, "later": 0, "total": 4}
+    assert stats["owner"] == expected
+    assert stats["all_owners"] == expected
+
+    # The all-owner totals live in shard rows, never in one row every writer would lock.
+    owner_id = created[0]["project"]["owner_id"]
+    stored = db_session.scalars(select(models.ProjectExpirationCount.owner_id)).all()
+    assert set(stored) == {owner_id, all_owners_shard(owner_id)}
+    report = verify_project_stats(db_session)
+    assert (report.mismatched, report.repaired) == (0, False)
+
+    db_session.execute(models.ProjectExpirationCount.__table__.delete())
+    report = verify_project_stats(db_session, repair=True)
+    assert report.repaired and report.mismatched > 0
+    assert client.get("/projects/stats", headers=headers).json()["owner"] == expected
+
+
+def test_archiver_moves_long_expired_projects(client: TestClient, db_session: Session) -> None:
+    register_user(client)
+    headers = {"Authorization": f"Bearer {obtain_token(client)}"}
+    today = date.today()
+    client.post(
+        "/projects/bulk",
+        json=[
+            {"name": f"Old {days}", "expiration_date": (today - timedelta(days=days)).isoformat()}
+            for days in (200, 120, 95, 10, -30)
+        ],
+        headers=headers,
+    )
+
+    report = archive_expired_projects(db_session, retention_days=90, batch_size=2, pause_seconds=0)
+    assert (report.archived, report.batches) == (3, 2)
+    assert verify_project_stats(db_session).mismatched == 0
+
+    live = client.get("/projects/", headers=headers).json()
+    assert sorted(project["name"] for project in live) == ["Old -30", "Old 10"]
+    first = client.get("/projects/archive", params={"limit": 2}, headers=headers)
+    assert [project["name"] for project in first.json()] == ["Old 95", "Old 120"]
+    assert first.json()[0]["archived_at"]
+    rest = client.get(
+        "/projects/archive",
+        params={"after": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    assert [project["name"] for project in rest.json()] == ["Old 200"]
+    assert "X-Next-Cursor" not in rest.headers
+
+
+def test_jobs_invalidate_only_a_shared_project_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    for shared, expected in ((False, "before"), (True, "after")):
+        project_cache = ProjectCache(TTLCache(10), shared=shared)
+        monkeypatch.setattr("app.cache.get_project_cache", lambda: project_cache)
+        project_cache.get_or_load(1, ("page",), lambda: "before")
+
+        invalidate_owners_from_job([1, 1])
+        assert project_cache.get_or_load(1, ("page",), lambda: "after") == expected
+
+
+def test_project_list_revalidation_sees_deletes(client: TestClient) -> None:
+    register_user(client)
+    token = obtain_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    expiration = (date.today() + timedelta(days=30)).isoformat()
+    ids = [
+        client.post(
+            "/projects/",
+            json={"name": f"Listed {index}", "expiration_date": expiration},
+            headers=headers,
+        ).json()["id"]
+        for index in range(2)
+    ]
+
+    listing = client.get("/projects/", headers=headers)
+    assert "Last-Modified" not in listing.headers
+    list_tag = listing.headers["ETag"]
+    # Deleting the older project leaves the newest updated_at unchanged.
+    assert client.delete(f"/projects/{ids[0]}", headers=headers).status_code == 204
+
+    tomorrow = format_datetime(datetime.now(timezone.utc) + timedelta(days=1), usegmt=True)
+    for validator in ({"If-None-Match": list_tag}, {"If-Modified-Since": tomorrow}):
+        revalidated = client.get("/projects/", headers={**headers, **validator})
+        assert revalidated.status_code == 200, validator
+        assert [project["id"] for project in revalidated.json()] == [ids[1]]